@@ -17,6 +17,7 @@ source venv/bin/activate
 echo "Installing dependencies..."
 pip install -q -r src/requirements.txt
 pip install -q rbc_security 2>/dev/null || true  # Optional: only available in RBC environment
+pip install -q waitress 2>/dev/null || true  # Optional: production WSGI server
 
 # Check for .env file
 if [ ! -f "src/.env" ]; then
@@ -3,12 +3,14 @@
 
 import os
 import sys
+import hashlib
 import logging
 import webbrowser
 import threading
 from pathlib import Path
 
-from flask import Flask, send_from_directory
+import requests
+from flask import Flask, Response, request
 from flask_cors import CORS
 from dotenv import load_dotenv
 
@@ -36,7 +38,9 @@ from handlers import proxy_bp, dashboard_bp, ProcessManager
 def create_app() -> Flask:
     """Create and configure the Flask application."""
     app = Flask(__name__, template_folder=str(SRC_DIR / 'templates'))
-    CORS(app)
+    # Scope CORS to the dashboard API so the after_request handler doesn't
+    # run on the proxy streaming path or static routes
+    CORS(app, resources={r"/api/*": {"origins": "*"}})
 
     # Load configuration
     config = Config()
@@ -76,6 +80,20 @@ def create_app() -> Flask:
 
     app.config['OAUTH_MANAGER'] = oauth_manager
 
+    # One process-wide upstream HTTP session so TCP/TLS connections are
+    # pooled and reused across proxied requests instead of a fresh
+    # handshake per call
+    http_session = requests.Session()
+    http_session.verify = config.get_verify_ssl()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=128,
+        max_retries=0
+    )
+    http_session.mount('https://', adapter)
+    http_session.mount('http://', adapter)
+    app.config['HTTP_SESSION'] = http_session
+
     # Initialize process manager
     process_manager = ProcessManager(config.port, config.proxy_access_token)
     app.config['PROCESS_MANAGER'] = process_manager
@@ -84,10 +102,20 @@ def create_app() -> Flask:
     app.register_blueprint(proxy_bp)
     app.register_blueprint(dashboard_bp)
 
-    # Dashboard route
+    # Dashboard route - the HTML shell is static, so read it once and
+    # serve the cached bytes instead of stat/open per hit
+    index_bytes = (SRC_DIR / 'templates' / 'index.html').read_bytes()
+    index_etag = hashlib.md5(index_bytes).hexdigest()
+
     @app.route('/')
     def dashboard():
-        return send_from_directory(SRC_DIR / 'templates', 'index.html')
+        if request.headers.get('If-None-Match') == index_etag:
+            return '', 304
+        return Response(
+            index_bytes,
+            mimetype='text/html',
+            headers={'ETag': index_etag, 'Cache-Control': 'no-cache'}
+        )
 
     # Log startup info
     log_manager.log_server_event('info', 'CC-Launcher started', {
@@ -101,11 +129,48 @@ def create_app() -> Flask:
     return app
 
 
-def open_browser(port: int):
-    """Open browser after a short delay."""
-    import time
-    time.sleep(1.5)
-    webbrowser.open(f'http://localhost:{port}')
+def schedule_browser_open(url: str):
+    """Open the dashboard in a browser shortly after the server starts."""
+    # The Werkzeug reloader re-runs main() in a child process marked by
+    # WERKZEUG_RUN_MAIN; skip it so the browser only opens once
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        return
+
+    timer = threading.Timer(1.5, webbrowser.open, args=(url,))
+    timer.daemon = True
+    timer.start()
+
+
+def _run_server(app: Flask, config):
+    """
+    Serve the app, preferring a production WSGI server when available.
+
+    The proxy workload is long-lived streaming responses, so the server
+    must let many response iterators advance concurrently. Waitress runs
+    one thread per in-flight request, which fits that shape; an
+    ASGI-wrapped event loop (asgiref's WsgiToAsgi) does not - it drives
+    every WSGI call through a single shared worker thread, so one active
+    stream would starve all other requests.
+    """
+    # Preferred: waitress, a production WSGI server with a properly
+    # buffered HTTP implementation and keep-alive support
+    try:
+        from waitress import serve
+    except ImportError:
+        pass
+    else:
+        logger.info("Serving via waitress (production WSGI server)")
+        serve(app, host='0.0.0.0', port=config.port, threads=16)
+        return
+
+    # Fallback: Werkzeug's dev server
+    logger.info("waitress not available - using Flask dev server")
+    app.run(
+        host='0.0.0.0',
+        port=config.port,
+        debug=False,
+        threaded=True
+    )
 
 
 def main():
@@ -119,8 +184,8 @@ def main():
     print("  CC-Launcher - Claude Code Launcher & Proxy Dashboard")
     print("=" * 60)
     print()
-    print(f"  Dashboard:  http://localhost:{config.port}")
-    print(f"  Proxy URL:  http://localhost:{config.port}/v1/messages")
+    print(f"  Dashboard:  {config.local_base_url}")
+    print(f"  Proxy URL:  {config.local_base_url}/v1/messages")
     print()
     print(f"  Target:     {config.target_endpoint}")
     print(f"  Mode:       {'Placeholder' if config.use_placeholder_mode else 'Proxy'}")
@@ -128,7 +193,7 @@ def main():
     print()
     print("  To use with Claude Code, set these environment variables:")
     print()
-    print(f"    export ANTHROPIC_BASE_URL='http://localhost:{config.port}'")
+    print(f"    export ANTHROPIC_BASE_URL='{config.local_base_url}'")
     print(f"    export ANTHROPIC_AUTH_TOKEN='{config.proxy_access_token}'")
     print()
     print("=" * 60)
@@ -136,16 +201,11 @@ def main():
 
     # Open browser if configured
     if config.auto_open_browser:
-        threading.Thread(target=open_browser, args=(config.port,), daemon=True).start()
+        schedule_browser_open(config.local_base_url)
 
-    # Run the Flask app
+    # Run the server
     try:
-        app.run(
-            host='0.0.0.0',
-            port=config.port,
-            debug=False,
-            threaded=True
-        )
+        _run_server(app, config)
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     except Exception as e:
@@ -1,18 +1,46 @@
 """Configuration management for cc-launcher."""
 
 import os
+import re
+import sys
 import secrets
 import logging
+from types import MappingProxyType
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+__all__ = ['Config', 'setup_ssl']
+
 
 class Config:
-    """Application configuration loaded from environment variables."""
+    """
+    Application configuration loaded from environment variables.
+
+    All environment parsing and coercion happens once in __init__;
+    handlers read plain attributes afterwards. __slots__ removes the
+    per-instance __dict__, which speeds up the attribute reads that sit
+    on the proxy hot path (port, tokens, mode flags).
+    """
+
+    __slots__ = (
+        'port', 'local_base_url', 'proxy_access_token',
+        'target_endpoint', 'target_api_key', 'use_placeholder_mode',
+        'model_mapping', 'default_max_tokens',
+        '_normalized_map', '_family_fallbacks', '_family_re',
+        '_model_cache', '_unmapped_warned',
+        'token_pricing', '_pricing', '_pricing_rules',
+        'oauth_token_endpoint', 'oauth_client_id', 'oauth_client_secret',
+        'oauth_scope', 'oauth_refresh_buffer_minutes',
+        'dev_mode', 'skip_ssl_verify', 'auto_open_browser',
+        '_ssl_enabled', '_verify', '_dict',
+    )
 
     def __init__(self):
         # Proxy settings
         self.port = int(os.getenv('PROXY_PORT', '5000'))
+        # Built once and interned - embedded in banners, payloads, and env
+        self.local_base_url = sys.intern(f'http://localhost:{self.port}')
         self.proxy_access_token = os.getenv('PROXY_ACCESS_TOKEN') or self._generate_token()
 
         # Target endpoint
@@ -25,6 +53,31 @@ class Config:
         self.model_mapping = self._parse_model_mapping(os.getenv('MODEL_MAPPING', ''))
         self.default_max_tokens = int(os.getenv('DEFAULT_MAX_TOKENS', '16384'))
 
+        # Precomputed lookup tables so map_model_name is a dict hit or two
+        # per request instead of re-normalizing and scanning the mapping
+        self._normalized_map = {
+            source.replace('.', '-'): target
+            for source, target in self.model_mapping.items()
+        }
+        self._family_fallbacks = {
+            family: self.model_mapping[family]
+            for family in ('haiku', 'opus', 'sonnet')
+            if family in self.model_mapping
+        }
+        # Single compiled scan over the configured families replaces
+        # per-request Python substring loops
+        self._family_re = (
+            re.compile('|'.join(self._family_fallbacks))
+            if self._family_fallbacks else None
+        )
+
+        # Memoized map_model_name results - only a handful of distinct
+        # model names ever come through, so steady state is one dict hit
+        self._model_cache: dict = {}
+
+        # Models we've already warned about having no mapping for
+        self._unmapped_warned: set = set()
+
         # Token pricing (cost per million tokens in USD)
         self.token_pricing = {
             'opus': {
@@ -41,6 +94,20 @@ class Config:
             },
         }
 
+        # Flattened per-token rates with the per-million divide baked in,
+        # so calculate_cost is two multiplies per call
+        self._pricing = {
+            family: (tier['prompt'] / 1_000_000, tier['completion'] / 1_000_000)
+            for family, tier in self.token_pricing.items()
+        }
+
+        # Pricing tiers in match order; sonnet is the default tier so it
+        # doesn't need a keyword entry
+        self._pricing_rules = (
+            ('opus', self._pricing['opus']),
+            ('haiku', self._pricing['haiku']),
+        )
+
         # OAuth settings
         self.oauth_token_endpoint = os.getenv('OAUTH_TOKEN_ENDPOINT')
         self.oauth_client_id = os.getenv('OAUTH_CLIENT_ID')
@@ -53,21 +120,30 @@ class Config:
         self.skip_ssl_verify = os.getenv('SKIP_SSL_VERIFY', 'false').lower() == 'true'
         self.auto_open_browser = os.getenv('AUTO_OPEN_BROWSER', 'true').lower() == 'true'
 
-        # SSL verification state (set by setup_ssl)
-        self.ssl_enabled = True
+        # SSL verification state (set by setup_ssl); the resolved verify
+        # flag is kept in sync by the ssl_enabled setter so request
+        # handlers read one attribute instead of re-deriving it
+        self._ssl_enabled = True
+        self._verify = not self.skip_ssl_verify
+
+        # Cached to_dict payload, rebuilt lazily after mutation
+        self._dict: Optional[MappingProxyType] = None
+
+    # One pass over the env string replaces per-pair split/strip calls
+    _MAPPING_PAIR_RE = re.compile(r'\s*([^=,]+?)\s*=\s*([^,]+?)\s*(?:,|$)')
 
     def _parse_model_mapping(self, mapping_str: str) -> dict:
         """Parse model mapping from environment (format: source=target,source2=target2)."""
-        mapping = {}
         if not mapping_str:
-            return mapping
+            return {}
 
-        for pair in mapping_str.split(','):
-            if '=' in pair:
-                source, target = pair.split('=', 1)
-                mapping[source.strip()] = target.strip()
-
-        return mapping
+        # Keys are lowercased so lookups never re-normalize the mapping
+        # side, and interned so the per-request dict hits compare by
+        # identity for the usual repeated model names
+        return {
+            sys.intern(source.lower()): sys.intern(target)
+            for source, target in self._MAPPING_PAIR_RE.findall(mapping_str)
+        }
 
     def map_model_name(self, claude_model: str) -> str:
         """
@@ -77,40 +153,57 @@ class Config:
         - Any model containing 'sonnet' -> sonnet mapping
         - Any model containing 'opus' -> opus mapping
         - Any model containing 'haiku' -> haiku mapping
+
+        Results are memoized per model name, so the full resolution only
+        runs once per unique model over the server lifetime.
         """
-        claude_model_lower = claude_model.lower()
+        cached = self._model_cache.get(claude_model)
+        if cached is not None:
+            return cached
+
+        mapped = self._resolve_model_name(claude_model)
+
+        # Bound the cache with simple FIFO eviction (dicts keep insertion order)
+        if len(self._model_cache) >= 512:
+            self._model_cache.pop(next(iter(self._model_cache)))
+        self._model_cache[claude_model] = mapped
+
+        return mapped
 
-        logger.info(f"Model mapping: input={claude_model}")
+    def _resolve_model_name(self, claude_model: str) -> str:
+        """Resolve a model name against the configured mapping (uncached)."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        lowered = claude_model.lower()
 
-        # Check for exact mapping first
-        if claude_model in self.model_mapping:
-            mapped = self.model_mapping[claude_model]
-            logger.info(f"Model mapping (exact): {claude_model} -> {mapped}")
+        # Check for exact mapping first (mapping keys are pre-lowered)
+        mapped = self.model_mapping.get(lowered)
+        if mapped is not None:
+            if debug:
+                logger.debug("Model mapping (exact): %s -> %s", claude_model, mapped)
             return mapped
 
-        # Simple family-based matching: look for model family keywords
-        # Order matters: check more specific families first
-
-        # Haiku family
-        if 'haiku' in claude_model_lower:
-            if 'haiku' in self.model_mapping:
-                logger.info(f"Model mapping (haiku): {claude_model} -> {self.model_mapping['haiku']}")
-                return self.model_mapping['haiku']
-
-        # Opus family
-        if 'opus' in claude_model_lower:
-            if 'opus' in self.model_mapping:
-                logger.info(f"Model mapping (opus): {claude_model} -> {self.model_mapping['opus']}")
-                return self.model_mapping['opus']
-
-        # Sonnet family (check last as it's most common)
-        if 'sonnet' in claude_model_lower:
-            if 'sonnet' in self.model_mapping:
-                logger.info(f"Model mapping (sonnet): {claude_model} -> {self.model_mapping['sonnet']}")
-                return self.model_mapping['sonnet']
-
-        # Pass through unchanged
-        logger.warning(f"No model mapping for {claude_model}, passing through unchanged")
+        # Normalized mapping ('.' treated as '-')
+        normalized = lowered.replace('.', '-')
+        mapped = self._normalized_map.get(normalized)
+        if mapped is not None:
+            if debug:
+                logger.debug("Model mapping (normalized): %s -> %s", claude_model, mapped)
+            return mapped
+
+        # Family-based fallback - one compiled regex scan over the name
+        if self._family_re is not None:
+            match = self._family_re.search(normalized)
+            if match:
+                family = match.group(0)
+                mapped = self._family_fallbacks[family]
+                if debug:
+                    logger.debug("Model mapping (%s): %s -> %s", family, claude_model, mapped)
+                return mapped
+
+        # Pass through unchanged - only warn once per unseen model
+        if claude_model not in self._unmapped_warned:
+            self._unmapped_warned.add(claude_model)
+            logger.warning("No model mapping for %s, passing through unchanged", claude_model)
         return claude_model
 
     def _generate_token(self) -> str:
@@ -131,20 +224,13 @@ class Config:
         """
         model_lower = model.lower()
 
-        # Determine which pricing tier to use
-        if 'opus' in model_lower:
-            pricing = self.token_pricing['opus']
-        elif 'haiku' in model_lower:
-            pricing = self.token_pricing['haiku']
-        else:
-            # Default to sonnet pricing
-            pricing = self.token_pricing['sonnet']
-
-        # Cost = (tokens / 1,000,000) * cost_per_million
-        prompt_cost = (input_tokens / 1_000_000) * pricing['prompt']
-        completion_cost = (output_tokens / 1_000_000) * pricing['completion']
+        # Determine which pricing tier to use (sonnet is the default)
+        prompt_rate, completion_rate = next(
+            (rates for keyword, rates in self._pricing_rules if keyword in model_lower),
+            self._pricing['sonnet']
+        )
 
-        return prompt_cost + completion_cost
+        return input_tokens * prompt_rate + output_tokens * completion_rate
 
     def is_oauth_configured(self) -> bool:
         """Check if OAuth is configured."""
@@ -160,24 +246,44 @@ class Config:
 
     def get_verify_ssl(self) -> bool:
         """Get SSL verification setting."""
-        if self.skip_ssl_verify:
-            return False
-        return self.ssl_enabled
+        return self._verify
 
-    def to_dict(self) -> dict:
-        """Return configuration as dictionary (for API response)."""
-        return {
-            'port': self.port,
-            'target_endpoint': self.target_endpoint,
-            'use_placeholder_mode': self.use_placeholder_mode,
-            'model_mapping': self.model_mapping,
-            'default_max_tokens': self.default_max_tokens,
-            'oauth_configured': self.is_oauth_configured(),
-            'api_key_configured': self.is_api_key_configured(),
-            'dev_mode': self.dev_mode,
-            'ssl_enabled': self.ssl_enabled,
-            'token_pricing': self.token_pricing,
-        }
+    @property
+    def ssl_enabled(self) -> bool:
+        """SSL verification state (set by setup_ssl)."""
+        return self._ssl_enabled
+
+    @ssl_enabled.setter
+    def ssl_enabled(self, value: bool):
+        self._ssl_enabled = value
+        self._verify = False if self.skip_ssl_verify else value
+        self._dict = None  # cached to_dict payload is now stale
+
+    def to_dict(self) -> MappingProxyType:
+        """
+        Return configuration as an immutable mapping (for API response).
+
+        The mapping is built once and reused across polls; mutating a
+        config attribute (currently only ssl_enabled) invalidates it.
+        """
+        if self._dict is None:
+            self._dict = MappingProxyType({
+                'port': self.port,
+                'target_endpoint': self.target_endpoint,
+                'use_placeholder_mode': self.use_placeholder_mode,
+                'model_mapping': self.model_mapping,
+                'default_max_tokens': self.default_max_tokens,
+                'oauth_configured': self.is_oauth_configured(),
+                'api_key_configured': self.is_api_key_configured(),
+                'dev_mode': self.dev_mode,
+                'ssl_enabled': self._ssl_enabled,
+                'token_pricing': self.token_pricing,
+            })
+        return self._dict
+
+
+# Cached setup_ssl result - the import/enable only needs to run once per process
+_ssl_setup_result: Optional[bool] = None
 
 
 def setup_ssl() -> bool:
@@ -185,7 +291,19 @@ def setup_ssl() -> bool:
     Setup SSL/RBC Security with graceful fallback.
 
     Returns True if SSL verification should be enabled, False otherwise.
+    The result is cached, so repeated app-factory invocations (tests,
+    worker reloads) don't re-run the import machinery.
     """
+    global _ssl_setup_result
+    if _ssl_setup_result is not None:
+        return _ssl_setup_result
+
+    _ssl_setup_result = _setup_ssl_uncached()
+    return _ssl_setup_result
+
+
+def _setup_ssl_uncached() -> bool:
+    """Perform the actual rbc_security import and enablement."""
     try:
         import rbc_security
         rbc_security.enable_certs()
@@ -195,5 +313,5 @@ def setup_ssl() -> bool:
         logger.warning("rbc_security not available - SSL verification disabled")
         return False
     except Exception as e:
-        logger.warning(f"rbc_security setup failed: {e} - SSL verification disabled")
+        logger.warning("rbc_security setup failed: %s - SSL verification disabled", e)
         return False
@@ -1,40 +1,54 @@
 """Dashboard API endpoints for cc-launcher."""
 
 import os
+import json
+import time
+import hashlib
 import logging
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
 
-def get_config():
-    """Get config from Flask app context."""
-    from flask import current_app
-    return current_app.config['CC_CONFIG']
+def _json_bytes(obj) -> bytes:
+    """Serialize to JSON bytes, preferring orjson's C implementation."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
 
 
-def get_log_manager():
-    """Get log manager from Flask app context."""
-    from flask import current_app
-    return current_app.config['LOG_MANAGER']
+def ojsonify(obj) -> Response:
+    """jsonify replacement that skips Flask's default encoder."""
+    return Response(_json_bytes(obj), mimetype='application/json')
 
 
-def get_process_manager():
-    """Get process manager from Flask app context."""
-    from flask import current_app
-    return current_app.config.get('PROCESS_MANAGER')
+@dashboard_bp.record_once
+def _cache_managers(setup_state):
+    """
+    Cache app-level managers on the blueprint at registration time.
 
+    The dashboard endpoints are polled continuously; resolving the
+    managers once here skips the current_app LocalProxy dereference and
+    config dict lookups on every request.
+    """
+    app_config = setup_state.app.config
+    dashboard_bp._config = app_config['CC_CONFIG']
+    dashboard_bp._log_manager = app_config['LOG_MANAGER']
+    dashboard_bp._process_manager = app_config.get('PROCESS_MANAGER')
 
-@dashboard_bp.route('/api/config', methods=['GET'])
-def get_configuration():
-    """Get current configuration (with sensitive data redacted)."""
-    config = get_config()
-
-    return jsonify({
+    # Configuration is immutable after startup, so serialize the
+    # /api/config payload once instead of on every poll
+    config = dashboard_bp._config
+    dashboard_bp._config_payload = _json_bytes({
         'port': config.port,
-        'localBaseUrl': f'http://localhost:{config.port}',
+        'localBaseUrl': config.local_base_url,
         'targetEndpoint': config.target_endpoint,
         'accessToken': config.proxy_access_token,
         'usePlaceholderMode': config.use_placeholder_mode,
@@ -45,11 +59,55 @@ def get_configuration():
         'devMode': config.dev_mode,
         'sslEnabled': config.ssl_enabled,
     })
+    dashboard_bp._config_etag = hashlib.md5(dashboard_bp._config_payload).hexdigest()
+
+
+# /api/status cache: (expiry based on monotonic clock, payload, etag)
+_STATUS_TTL_SECONDS = 0.5
+_status_cache = [0.0, None, None]
+
+
+def get_config():
+    """Get config cached on the blueprint."""
+    return dashboard_bp._config
+
+
+def get_log_manager():
+    """Get log manager cached on the blueprint."""
+    return dashboard_bp._log_manager
+
+
+def get_process_manager():
+    """Get process manager cached on the blueprint."""
+    return dashboard_bp._process_manager
+
+
+@dashboard_bp.route('/api/config', methods=['GET'])
+def get_configuration():
+    """Get current configuration (with sensitive data redacted)."""
+    # Config is static after startup, so steady-state polls collapse to a 304
+    etag = dashboard_bp._config_etag
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+    return Response(
+        dashboard_bp._config_payload,
+        mimetype='application/json',
+        headers={'ETag': etag}
+    )
 
 
 @dashboard_bp.route('/api/status', methods=['GET'])
 def get_status():
     """Get current system status."""
+    # Served from a short-lived cache - the dashboard polls this endpoint
+    # continuously and the underlying state changes at request granularity
+    now = time.monotonic()
+    if _status_cache[1] is not None and now < _status_cache[0]:
+        if request.headers.get('If-None-Match') == _status_cache[2]:
+            return '', 304
+        return Response(_status_cache[1], mimetype='application/json',
+                        headers={'ETag': _status_cache[2]})
+
     config = get_config()
     process_manager = get_process_manager()
 
@@ -69,7 +127,15 @@ def get_status():
         }
     }
 
-    return jsonify(status)
+    payload = _json_bytes(status)
+    etag = hashlib.md5(payload).hexdigest()
+    _status_cache[0] = now + _STATUS_TTL_SECONDS
+    _status_cache[1] = payload
+    _status_cache[2] = etag
+
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+    return Response(payload, mimetype='application/json', headers={'ETag': etag})
 
 
 @dashboard_bp.route('/api/logs', methods=['GET'])
@@ -78,7 +144,7 @@ def get_logs():
     log_manager = get_log_manager()
     limit = request.args.get('limit', 50, type=int)
 
-    return jsonify({
+    return ojsonify({
         'apiCalls': log_manager.get_api_calls(limit),
         'serverEvents': log_manager.get_server_events(limit),
     })
@@ -90,7 +156,7 @@ def get_api_logs():
     log_manager = get_log_manager()
     limit = request.args.get('limit', 50, type=int)
 
-    return jsonify(log_manager.get_api_calls(limit))
+    return ojsonify(log_manager.get_api_calls(limit))
 
 
 @dashboard_bp.route('/api/logs/server-events', methods=['GET'])
@@ -99,7 +165,7 @@ def get_server_logs():
     log_manager = get_log_manager()
     limit = request.args.get('limit', 50, type=int)
 
-    return jsonify(log_manager.get_server_events(limit))
+    return ojsonify(log_manager.get_server_events(limit))
 
 
 @dashboard_bp.route('/api/logs', methods=['DELETE'])
@@ -108,7 +174,7 @@ def clear_logs():
     log_manager = get_log_manager()
     log_manager.clear_logs()
 
-    return jsonify({'success': True, 'message': 'Logs cleared'})
+    return ojsonify({'success': True, 'message': 'Logs cleared'})
 
 
 @dashboard_bp.route('/api/usage', methods=['GET'])
@@ -116,7 +182,7 @@ def get_usage():
     """Get usage statistics."""
     log_manager = get_log_manager()
 
-    return jsonify(log_manager.get_usage_stats())
+    return ojsonify(log_manager.get_usage_stats())
 
 
 @dashboard_bp.route('/api/usage/reset', methods=['POST'])
@@ -125,7 +191,7 @@ def reset_usage():
     log_manager = get_log_manager()
     log_manager.reset_usage()
 
-    return jsonify({'success': True, 'message': 'Usage statistics reset'})
+    return ojsonify({'success': True, 'message': 'Usage statistics reset'})
 
 
 @dashboard_bp.route('/api/claude/launch', methods=['POST'])
@@ -134,7 +200,7 @@ def launch_claude():
     process_manager = get_process_manager()
 
     if not process_manager:
-        return jsonify({'success': False, 'error': 'Process manager not available'}), 500
+        return ojsonify({'success': False, 'error': 'Process manager not available'}), 500
 
     data = request.get_json() or {}
     working_directory = data.get('workingDirectory')
@@ -144,14 +210,14 @@ def launch_claude():
     if success:
         log_manager = get_log_manager()
         log_manager.log_server_event('info', f'Claude Code launched in {working_directory or "home directory"}')
-        return jsonify({
+        return ojsonify({
             'success': True,
             'message': message,
             'workingDirectory': process_manager.working_directory
         })
     else:
         logger.error(f"Failed to launch Claude Code: {message}")
-        return jsonify({'success': False, 'error': message}), 400
+        return ojsonify({'success': False, 'error': message}), 400
 
 
 @dashboard_bp.route('/api/claude/status', methods=['GET'])
@@ -160,9 +226,9 @@ def claude_status():
     process_manager = get_process_manager()
 
     if not process_manager:
-        return jsonify({'launched': False, 'workingDirectory': None})
+        return ojsonify({'launched': False, 'workingDirectory': None})
 
-    return jsonify({
+    return ojsonify({
         'launched': process_manager.is_claude_running(),
         'workingDirectory': process_manager.working_directory,
     })
@@ -178,44 +244,53 @@ def browse_directories():
 
     # Security: ensure path exists and is a directory
     if not os.path.exists(path):
-        return jsonify({'error': 'Path does not exist', 'path': path}), 404
+        return ojsonify({'error': 'Path does not exist', 'path': path}), 404
 
     if not os.path.isdir(path):
         # If it's a file, return the parent directory
         path = os.path.dirname(path)
 
     try:
-        items = []
-        for name in sorted(os.listdir(path)):
-            full_path = os.path.join(path, name)
-            # Skip hidden files/dirs (starting with .) and system dirs
-            if name.startswith('.'):
-                continue
-            try:
-                is_dir = os.path.isdir(full_path)
-                items.append({
+        # Single scandir pass - DirEntry.is_dir() reads the readdir d_type
+        # field, avoiding the per-entry stat that listdir + isdir costs
+        # Each element is (files_last, name_lower, item) so the sort key
+        # is computed once per entry instead of on every comparison
+        keyed = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Skip hidden files/dirs (starting with .) and system dirs
+                name = entry.name
+                if name.startswith('.'):
+                    continue
+                try:
+                    # Follows symlinks (matching os.path.isdir) so a
+                    # linked directory stays browsable; only symlink
+                    # entries pay a stat
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                keyed.append((not is_dir, name.lower(), {
                     'name': name,
-                    'path': full_path,
+                    'path': entry.path,
                     'isDirectory': is_dir,
-                })
-            except PermissionError:
-                continue
+                }))
 
         # Sort directories first, then files
-        items.sort(key=lambda x: (not x['isDirectory'], x['name'].lower()))
+        keyed.sort(key=lambda t: (t[0], t[1]))
+        items = [t[2] for t in keyed]
 
-        return jsonify({
+        return ojsonify({
             'currentPath': path,
             'parentPath': os.path.dirname(path) if path != '/' else None,
             'items': items,
         })
     except PermissionError:
-        return jsonify({'error': 'Permission denied', 'path': path}), 403
+        return ojsonify({'error': 'Permission denied', 'path': path}), 403
     except Exception as e:
-        return jsonify({'error': str(e), 'path': path}), 500
+        return ojsonify({'error': str(e), 'path': path}), 500
 
 
 @dashboard_bp.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'service': 'cc-launcher'})
+    return ojsonify({'status': 'healthy', 'service': 'cc-launcher'})
@@ -2,61 +2,179 @@
 
 import os
 import sys
+import time
+import asyncio
+import functools
+import shlex
+import tempfile
+import threading
 import subprocess
 import shutil
 import logging
+from string import Template
 from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _which(cmd: str) -> Optional[str]:
+    """shutil.which with the $PATH walk memoized per command."""
+    return shutil.which(cmd)
+
+# AppleScript template for the macOS launch. Values arrive as argv (via
+# 'osascript -'), so nothing user-controlled is interpolated into the
+# script source and the template itself is built exactly once.
+_OSASCRIPT_TEMPLATE = '''
+on run argv
+    set wd to item 1 of argv
+    set baseUrl to item 2 of argv
+    set authToken to item 3 of argv
+    set isolatedHome to item 4 of argv
+    set shellCmd to "cd " & quoted form of wd
+    set shellCmd to shellCmd & " && export HOME=" & quoted form of isolatedHome
+    set shellCmd to shellCmd & " && export ANTHROPIC_BASE_URL=" & quoted form of baseUrl
+    set shellCmd to shellCmd & " && export ANTHROPIC_AUTH_TOKEN=" & quoted form of authToken
+    set shellCmd to shellCmd & " && export ANTHROPIC_API_KEY=" & quoted form of authToken
+    set shellCmd to shellCmd & " && export DISABLE_AUTOUPDATER=1 && export DISABLE_TELEMETRY=1"
+    set shellCmd to shellCmd & " && echo '=== CC-Launcher Isolated Session ==='"
+    set shellCmd to shellCmd & " && echo 'Proxy: " & baseUrl & "'"
+    set shellCmd to shellCmd & " && echo 'Home: " & isolatedHome & "'"
+    set shellCmd to shellCmd & " && echo '===================================' && claude"
+    tell application "Terminal"
+        activate
+        do script shellCmd
+    end tell
+end run
+'''
+
+# Shell command template for the Linux launch, built once at import.
+# Values are shlex-quoted at substitution time, so a working directory
+# containing quotes can't break out of the command.
+_LINUX_CMD_TEMPLATE = Template(
+    'cd $wd'
+    ' && export ANTHROPIC_BASE_URL=$base_url'
+    ' && export ANTHROPIC_AUTH_TOKEN=$auth_token'
+    ' && export ANTHROPIC_API_KEY=$api_key'
+    ' && claude; exec bash'
+)
+
+
 class ProcessManager:
     """Manages Claude Code process launching."""
 
     def __init__(self, proxy_port: int, proxy_token: str):
         self.proxy_port = proxy_port
         self.proxy_token = proxy_token
+        self.proxy_base_url = f'http://localhost:{proxy_port}'
         self.working_directory: Optional[str] = None
         self._launched = False
+        self._cached_terminal: Optional[Tuple[str, list]] = None
+        if sys.platform == 'linux':
+            # Probe for a terminal emulator up front so launch requests
+            # never pay the discovery walk
+            self._find_linux_terminal()
+        self._proc: Optional[subprocess.Popen] = None
+        self._isolated_home: Optional[str] = None
+        # Prewarmed isolated-home dir for macOS launches - mkdtemp can
+        # block on disk sync, so create the next one off the hot path
+        self._warm_home: Optional[str] = None
+        self._warm_home_ready = threading.Event()
+        if sys.platform == 'darwin':
+            threading.Thread(target=self._warm_isolated_home, daemon=True).start()
+        # (expiry, result) cache so tight dashboard polls don't hit syscalls
+        self._running_cache = (0.0, False)
+
+        # The manual launch command only depends on port/token, so build
+        # it once instead of per dashboard request
+        self._launch_cmd_str = f"""
+# Create isolated home to avoid conflicts with your Claude subscription
+export HOME=$(mktemp -d)
+export ANTHROPIC_BASE_URL='http://localhost:{proxy_port}'
+# IMPORTANT: Claude Code uses ANTHROPIC_AUTH_TOKEN for custom endpoints
+export ANTHROPIC_AUTH_TOKEN='{proxy_token}'
+export ANTHROPIC_API_KEY='{proxy_token}'
+export DISABLE_AUTOUPDATER=1
+export DISABLE_TELEMETRY=1
+claude
+""".strip()
+
+    def _warm_isolated_home(self):
+        """Pre-create the next isolated home directory in the background."""
+        self._warm_home = tempfile.mkdtemp(prefix='cc-launcher-home-')
+        self._warm_home_ready.set()
+
+    def _take_isolated_home(self) -> str:
+        """Take the prewarmed home dir (re-warming behind it), or make one inline."""
+        if self._warm_home_ready.wait(timeout=1.0) and self._warm_home:
+            home = self._warm_home
+            self._warm_home = None
+            self._warm_home_ready.clear()
+            # Warm the next one for users who launch multiple sessions
+            threading.Thread(target=self._warm_isolated_home, daemon=True).start()
+            return home
+        return tempfile.mkdtemp(prefix='cc-launcher-home-')
 
     def _is_claude_installed(self) -> bool:
         """Check if Claude Code CLI is installed."""
-        return shutil.which('claude') is not None
+        return _which('claude') is not None
 
     def _install_claude_code(self) -> Tuple[bool, str]:
         """
         Attempt to install Claude Code via npm.
 
+        Thin sync wrapper over the async variant for callers without a
+        running event loop (the Flask request threads).
+
+        Returns:
+            Tuple of (success, message)
+        """
+        return asyncio.run(self._install_claude_code_async())
+
+    async def _install_claude_code_async(self) -> Tuple[bool, str]:
+        """
+        Attempt to install Claude Code via npm without blocking the loop.
+
+        npm installs can take 10-60 s; running the process on the event
+        loop lets async callers keep serving while it works.
+
         Returns:
             Tuple of (success, message)
         """
         # Check if npm is available
-        if not shutil.which('npm'):
+        if not _which('npm'):
             return False, "npm not found. Please install Node.js first: https://nodejs.org/"
 
         logger.info("Installing Claude Code via npm...")
 
         try:
             # Run npm install globally
-            result = subprocess.run(
-                ['npm', 'install', '-g', '@anthropic-ai/claude-code'],
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout
+            proc = await asyncio.create_subprocess_exec(
+                'npm', 'install', '-g', '@anthropic-ai/claude-code',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-
-            if result.returncode == 0:
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=120  # 2 minute timeout
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                return False, "Installation timed out. Please install manually: npm install -g @anthropic-ai/claude-code"
+
+            if proc.returncode == 0:
                 logger.info("Claude Code installed successfully")
+                # Drop the memoized misses so the re-verification below
+                # actually re-probes $PATH for the new binary
+                _which.cache_clear()
                 return True, "Claude Code installed successfully"
             else:
-                error_msg = result.stderr.strip() or result.stdout.strip()
+                error_msg = stderr.decode().strip() or stdout.decode().strip()
                 # Common error: permission denied
                 if 'EACCES' in error_msg or 'permission denied' in error_msg.lower():
                     return False, "Permission denied. Try running: sudo npm install -g @anthropic-ai/claude-code"
                 return False, f"npm install failed: {error_msg[:200]}"
 
-        except subprocess.TimeoutExpired:
-            return False, "Installation timed out. Please install manually: npm install -g @anthropic-ai/claude-code"
         except Exception as e:
             return False, f"Installation failed: {str(e)}"
 
@@ -82,26 +200,29 @@ class ProcessManager:
 
         self.working_directory = working_directory or os.path.expanduser('~')
 
-        # Build environment with proxy settings
+        # Just the proxy settings - only the Linux/Windows Popen paths
+        # need a full environment, and they merge this in themselves, so
+        # macOS launches skip the os.environ copy entirely
         # IMPORTANT: Claude Code uses ANTHROPIC_AUTH_TOKEN (not ANTHROPIC_API_KEY) for custom endpoints
         # See: https://docs.anthropic.com/en/docs/claude-code/settings
-        env = os.environ.copy()
-        env['ANTHROPIC_BASE_URL'] = f'http://localhost:{self.proxy_port}'
-        env['ANTHROPIC_AUTH_TOKEN'] = self.proxy_token
-        # Also set API_KEY as fallback for older versions
-        env['ANTHROPIC_API_KEY'] = self.proxy_token
+        proxy_env = {
+            'ANTHROPIC_BASE_URL': self.proxy_base_url,
+            'ANTHROPIC_AUTH_TOKEN': self.proxy_token,
+            # Also set API_KEY as fallback for older versions
+            'ANTHROPIC_API_KEY': self.proxy_token,
+        }
 
-        logger.info(f"Launching Claude Code in {self.working_directory}")
-        logger.info(f"  ANTHROPIC_BASE_URL={env['ANTHROPIC_BASE_URL']}")
-        logger.info(f"  ANTHROPIC_AUTH_TOKEN={self.proxy_token[:20]}...")
+        logger.info("Launching Claude Code in %s", self.working_directory)
+        logger.info("  ANTHROPIC_BASE_URL=%s", self.proxy_base_url)
+        logger.info("  ANTHROPIC_AUTH_TOKEN=%s...", self.proxy_token[:20])
 
         try:
             if sys.platform == 'darwin':
-                self._launch_macos(env)
+                self._launch_macos(proxy_env)
             elif sys.platform == 'linux':
-                self._launch_linux(env)
+                self._launch_linux(proxy_env)
             elif sys.platform == 'win32':
-                self._launch_windows(env)
+                self._launch_windows(proxy_env)
             else:
                 return False, f"Unsupported platform: {sys.platform}"
         except RuntimeError as e:
@@ -110,36 +231,28 @@ class ProcessManager:
         self._launched = True
         return True, "Claude Code launched successfully"
 
-    def _launch_macos(self, env: dict):
+    def _launch_macos(self, proxy_env: dict):
         """Launch in macOS Terminal.app."""
-        # Create isolated home directory for this proxy session
-        # This ensures Claude Code doesn't find any existing credentials
-        import tempfile
-        isolated_home = tempfile.mkdtemp(prefix='cc-launcher-home-')
-
-        # Build environment export commands
-        # Override HOME to completely isolate from user's config
-        # Claude Code looks in ~/.claude/ which will now be empty
-        # IMPORTANT: Use ANTHROPIC_AUTH_TOKEN for custom endpoints (not just API_KEY)
-        env_exports = (
-            f"export HOME='{isolated_home}' && "
-            f"export ANTHROPIC_BASE_URL='{env['ANTHROPIC_BASE_URL']}' && "
-            f"export ANTHROPIC_AUTH_TOKEN='{env['ANTHROPIC_AUTH_TOKEN']}' && "
-            f"export ANTHROPIC_API_KEY='{env['ANTHROPIC_API_KEY']}' && "
-            f"export DISABLE_AUTOUPDATER=1 && "
-            f"export DISABLE_TELEMETRY=1"
-        )
-
-        # AppleScript to open Terminal and run claude
-        script = f'''
-        tell application "Terminal"
-            activate
-            do script "cd '{self.working_directory}' && {env_exports} && echo '=== CC-Launcher Isolated Session ===' && echo 'Proxy: {env['ANTHROPIC_BASE_URL']}' && echo 'Home: {isolated_home}' && echo '===================================' && claude"
-        end tell
-        '''
-
+        # Isolated home directory for this proxy session (prewarmed at
+        # construction) ensures Claude Code finds no existing credentials
+        isolated_home = self._take_isolated_home()
+        self._isolated_home = isolated_home
+
+        # Run the shared AppleScript template, passing values as argv.
+        # HOME is overridden to completely isolate from the user's config
+        # (Claude Code looks in ~/.claude/, which will now be empty), and
+        # ANTHROPIC_AUTH_TOKEN is what Claude Code uses for custom endpoints.
         try:
-            subprocess.run(['osascript', '-e', script], check=True)
+            subprocess.run(
+                ['osascript', '-',
+                 self.working_directory,
+                 proxy_env['ANTHROPIC_BASE_URL'],
+                 proxy_env['ANTHROPIC_AUTH_TOKEN'],
+                 isolated_home],
+                input=_OSASCRIPT_TEMPLATE,
+                text=True,
+                check=True
+            )
             logger.info("Claude Code launched in Terminal.app")
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to launch Terminal: {e}")
@@ -148,65 +261,81 @@ class ProcessManager:
             logger.error("osascript not found - are you on macOS?")
             raise RuntimeError("osascript not found - Terminal launch requires macOS")
 
-    def _launch_linux(self, env: dict):
+    # Common terminal emulators, in preference order
+    _LINUX_TERMINALS = [
+        ('gnome-terminal', ['gnome-terminal', '--', 'bash', '-c']),
+        ('konsole', ['konsole', '-e', 'bash', '-c']),
+        ('xterm', ['xterm', '-e', 'bash', '-c']),
+        ('x-terminal-emulator', ['x-terminal-emulator', '-e', 'bash', '-c']),
+    ]
+
+    def _find_linux_terminal(self):
+        """Find an available terminal emulator (cached after first probe)."""
+        if self._cached_terminal is None:
+            self._cached_terminal = next(
+                ((name, base_cmd) for name, base_cmd in self._LINUX_TERMINALS
+                 if _which(name)),
+                None
+            )
+        return self._cached_terminal
+
+    def _launch_linux(self, proxy_env: dict):
         """Launch in Linux terminal emulator."""
-        # Try common terminal emulators
-        terminals = [
-            ('gnome-terminal', ['gnome-terminal', '--', 'bash', '-c']),
-            ('konsole', ['konsole', '-e', 'bash', '-c']),
-            ('xterm', ['xterm', '-e', 'bash', '-c']),
-            ('x-terminal-emulator', ['x-terminal-emulator', '-e', 'bash', '-c']),
-        ]
-
-        # Build command string
-        # Use both AUTH_TOKEN (for custom endpoints) and API_KEY (fallback)
-        env_exports = f"export ANTHROPIC_BASE_URL='{env['ANTHROPIC_BASE_URL']}' && export ANTHROPIC_AUTH_TOKEN='{env['ANTHROPIC_AUTH_TOKEN']}' && export ANTHROPIC_API_KEY='{env['ANTHROPIC_API_KEY']}'"
-        cmd_str = f"cd '{self.working_directory}' && {env_exports} && claude; exec bash"
+        # Probe PATH in-process instead of spawning 'which' per candidate
+        terminal = self._find_linux_terminal()
+        if terminal is None:
+            raise RuntimeError("No supported terminal emulator found (tried: gnome-terminal, konsole, xterm)")
 
-        for name, base_cmd in terminals:
-            try:
-                # Check if terminal exists
-                subprocess.run(['which', name], check=True, capture_output=True)
+        name, base_cmd = terminal
 
-                # Launch terminal
-                full_cmd = base_cmd + [cmd_str]
-                subprocess.Popen(full_cmd, env=env)
-                logger.info(f"Claude Code launched in {name}")
-                return
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
+        # Build command string from the shared template
+        # Use both AUTH_TOKEN (for custom endpoints) and API_KEY (fallback)
+        cmd_str = _LINUX_CMD_TEMPLATE.substitute(
+            wd=shlex.quote(self.working_directory),
+            base_url=shlex.quote(proxy_env['ANTHROPIC_BASE_URL']),
+            auth_token=shlex.quote(proxy_env['ANTHROPIC_AUTH_TOKEN']),
+            api_key=shlex.quote(proxy_env['ANTHROPIC_API_KEY']),
+        )
 
-        raise RuntimeError("No supported terminal emulator found (tried: gnome-terminal, konsole, xterm)")
+        full_cmd = base_cmd + [cmd_str]
+        self._proc = subprocess.Popen(full_cmd, env={**os.environ, **proxy_env})
+        logger.info(f"Claude Code launched in {name}")
 
-    def _launch_windows(self, env: dict):
+    def _launch_windows(self, proxy_env: dict):
         """Launch in Windows Command Prompt."""
         # Build command - use both AUTH_TOKEN and API_KEY
-        cmd = f'cd /d "{self.working_directory}" && set ANTHROPIC_BASE_URL={env["ANTHROPIC_BASE_URL"]} && set ANTHROPIC_AUTH_TOKEN={env["ANTHROPIC_AUTH_TOKEN"]} && set ANTHROPIC_API_KEY={env["ANTHROPIC_API_KEY"]} && claude'
+        cmd = f'cd /d "{self.working_directory}" && set ANTHROPIC_BASE_URL={proxy_env["ANTHROPIC_BASE_URL"]} && set ANTHROPIC_AUTH_TOKEN={proxy_env["ANTHROPIC_AUTH_TOKEN"]} && set ANTHROPIC_API_KEY={proxy_env["ANTHROPIC_API_KEY"]} && claude'
 
         try:
-            subprocess.Popen(['cmd', '/c', 'start', 'cmd', '/k', cmd], env=env)
+            self._proc = subprocess.Popen(['cmd', '/c', 'start', 'cmd', '/k', cmd],
+                                          env={**os.environ, **proxy_env})
             logger.info("Claude Code launched in Command Prompt")
         except FileNotFoundError:
             raise RuntimeError("Failed to launch Command Prompt")
 
     def is_claude_running(self) -> bool:
         """
-        Check if Claude Code was launched.
+        Check if Claude Code appears to be running.
 
-        Note: This only tracks if we launched it, not if the process is still running.
+        Uses the retained process handle where we have one (Linux/Windows).
+        On macOS the Terminal.app session owns the process, so the isolated
+        home directory still existing is used as a proxy. The result is
+        cached for 500 ms since the dashboard polls this continuously.
         """
-        return self._launched
+        now = time.monotonic()
+        if now < self._running_cache[0]:
+            return self._running_cache[1]
+
+        if self._proc is not None:
+            running = self._proc.poll() is None
+        elif self._isolated_home is not None:
+            running = os.path.isdir(self._isolated_home)
+        else:
+            running = self._launched
+
+        self._running_cache = (now + 0.5, running)
+        return running
 
     def get_launch_command(self) -> str:
         """Get the command to manually launch Claude Code with proxy settings."""
-        return f"""
-# Create isolated home to avoid conflicts with your Claude subscription
-export HOME=$(mktemp -d)
-export ANTHROPIC_BASE_URL='http://localhost:{self.proxy_port}'
-# IMPORTANT: Claude Code uses ANTHROPIC_AUTH_TOKEN for custom endpoints
-export ANTHROPIC_AUTH_TOKEN='{self.proxy_token}'
-export ANTHROPIC_API_KEY='{self.proxy_token}'
-export DISABLE_AUTOUPDATER=1
-export DISABLE_TELEMETRY=1
-claude
-""".strip()
+        return self._launch_cmd_str
@@ -1,40 +1,103 @@
 """Anthropic API proxy handler - translates to OpenAI format."""
 
+import json
 import time
 import logging
+from functools import lru_cache
+
 import requests
-from flask import Blueprint, request, jsonify, Response, stream_with_context, g
+from flask import Blueprint, request, Response, current_app, g
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from translator import translate_request, translate_response, StreamTranslator
+from translator import translate_request, translate_response
 from translator.openai_to_anthropic import translate_error, build_placeholder_response
-from translator.streaming import generate_placeholder_stream
+from translator.streaming import generate_placeholder_stream, acquire_translator, release_translator
 
 logger = logging.getLogger(__name__)
 
 proxy_bp = Blueprint('proxy', __name__)
 
 
+def _json_loads(data):
+    """Parse JSON bytes, preferring orjson's C implementation."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to JSON bytes, preferring orjson's C implementation."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_response(obj, status: int) -> Response:
+    """Build a JSON response without going through Flask's encoder."""
+    if orjson is not None:
+        body = orjson.dumps(obj)
+    else:
+        body = json.dumps(obj).encode('utf-8')
+    return Response(body, status=status, mimetype='application/json')
+
+
+def _auth_error(message: str):
+    """Build an (error dict, serialized body) pair for an auth failure."""
+    error = {'type': 'error', 'error': {'type': 'authentication_error', 'message': message}}
+    if orjson is not None:
+        return error, orjson.dumps(error)
+    return error, json.dumps(error).encode('utf-8')
+
+
+# Auth failures are a hot path under scanning - serialize the two
+# fixed payloads once at import
+_MISSING_KEY = _auth_error('Missing API key')
+_INVALID_KEY = _auth_error('Invalid API key')
+
+
+# Placeholder mode exists for dev/load testing, where the only variable
+# is the model name - cache the serialized forms so repeated requests
+# are plain byte writes
+@lru_cache(maxsize=32)
+def _placeholder_body(model: str) -> bytes:
+    return _json_dumps_bytes(build_placeholder_response(model))
+
+
+@lru_cache(maxsize=32)
+def _placeholder_frames(model: str) -> tuple:
+    return tuple(generate_placeholder_stream(model))
+
+
 def get_config():
     """Get config from Flask app context."""
-    from flask import current_app
     return current_app.config['CC_CONFIG']
 
 
 def get_oauth_manager():
     """Get OAuth manager from Flask app context."""
-    from flask import current_app
     return current_app.config.get('OAUTH_MANAGER')
 
 
 def get_log_manager():
     """Get log manager from Flask app context."""
-    from flask import current_app
     return current_app.config['LOG_MANAGER']
 
 
-def verify_api_key():
-    """Verify the x-api-key header matches proxy access token."""
-    config = get_config()
+def get_http_session():
+    """Get the shared upstream HTTP session from Flask app context."""
+    return current_app.config['HTTP_SESSION']
+
+
+def verify_api_key(config):
+    """
+    Verify the x-api-key header matches the proxy access token.
+
+    Returns None when valid, else an (error dict, serialized body) pair.
+    """
 
     # Check x-api-key header (Anthropic style)
     api_key = request.headers.get('x-api-key', '')
@@ -46,12 +109,12 @@ def verify_api_key():
             api_key = auth_header[7:]
 
     if not api_key:
-        return False, {'type': 'error', 'error': {'type': 'authentication_error', 'message': 'Missing API key'}}
+        return _MISSING_KEY
 
     if api_key != config.proxy_access_token:
-        return False, {'type': 'error', 'error': {'type': 'authentication_error', 'message': 'Invalid API key'}}
+        return _INVALID_KEY
 
-    return True, None
+    return None
 
 
 @proxy_bp.route('/v1/messages', methods=['POST'])
@@ -63,30 +126,36 @@ def messages():
     translates response back to Anthropic format.
     """
     start_time = time.time()
-    config = get_config()
-    log_manager = get_log_manager()
+    # Resolve the app config mapping once - every further lookup is a
+    # plain dict hit instead of a LocalProxy dereference
+    app_cfg = current_app.config
+    config = app_cfg['CC_CONFIG']
+    log_manager = app_cfg['LOG_MANAGER']
 
     # Verify API key
-    valid, error = verify_api_key()
-    if not valid:
+    auth_failure = verify_api_key(config)
+    if auth_failure is not None:
+        error, body = auth_failure
         duration_ms = int((time.time() - start_time) * 1000)
         log_manager.log_api_call('POST', '/v1/messages', 401, duration_ms, None, error)
-        return jsonify(error), 401
+        return Response(body, status=401, mimetype='application/json')
 
-    # Parse request
+    # Parse request - read the raw body once (uncached, so Werkzeug
+    # doesn't hold a second copy on the request) and decode it with the
+    # C-level parser instead of going through request.get_json()
     try:
-        anthropic_request = request.get_json()
+        anthropic_request = _json_loads(request.get_data(cache=False))
     except Exception as e:
         error = {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': f'Invalid JSON: {e}'}}
         duration_ms = int((time.time() - start_time) * 1000)
         log_manager.log_api_call('POST', '/v1/messages', 400, duration_ms, None, error)
-        return jsonify(error), 400
+        return _json_response(error, 400)
 
     if not anthropic_request:
         error = {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': 'Empty request body'}}
         duration_ms = int((time.time() - start_time) * 1000)
         log_manager.log_api_call('POST', '/v1/messages', 400, duration_ms, None, error)
-        return jsonify(error), 400
+        return _json_response(error, 400)
 
     # Store original model for response translation
     original_model = anthropic_request.get('model', 'claude-sonnet-4-20250514')
@@ -94,19 +163,20 @@ def messages():
 
     # Log incoming request
     num_messages = len(anthropic_request.get('messages', []))
-    logger.info(f"-> {original_model} | msgs={num_messages} | stream={is_streaming}")
+    logger.info("-> %s | msgs=%d | stream=%s", original_model, num_messages, is_streaming)
 
     # Placeholder mode - return mock response
     if config.use_placeholder_mode:
         if is_streaming:
             return _handle_placeholder_stream(original_model, anthropic_request, start_time, log_manager, config)
         else:
-            response = build_placeholder_response(original_model)
+            body = _placeholder_body(original_model)
             duration_ms = int((time.time() - start_time) * 1000)
             cost = config.calculate_cost(original_model, 100, 20)
-            log_manager.log_api_call('POST', '/v1/messages', 200, duration_ms, anthropic_request, response,
+            log_manager.log_api_call('POST', '/v1/messages', 200, duration_ms, anthropic_request,
+                                    {'placeholder': True},
                                     input_tokens=100, output_tokens=20, cost_usd=cost)
-            return jsonify(response), 200
+            return Response(body, status=200, mimetype='application/json')
 
     # Translate request to OpenAI format
     try:
@@ -115,50 +185,53 @@ def messages():
             config.map_model_name,
             config.default_max_tokens
         )
-        logger.info(f"Translated request: model={openai_request.get('model')}, messages={len(openai_request.get('messages', []))}")
+        logger.info("Translated request: model=%s, messages=%d",
+                    openai_request.get('model'), len(openai_request.get('messages', [])))
     except Exception as e:
         import traceback
-        logger.error(f"Translation error: {e}")
+        logger.error("Translation error: %s", e)
         logger.error(traceback.format_exc())
         error = {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': f'Translation error: {e}'}}
         duration_ms = int((time.time() - start_time) * 1000)
         log_manager.log_api_call('POST', '/v1/messages', 400, duration_ms, anthropic_request, error)
-        return jsonify(error), 400
+        return _json_response(error, 400)
 
     # Forward to target endpoint
     target_url = f"{config.target_endpoint}/chat/completions"
     headers = {'Content-Type': 'application/json'}
 
     # Add authorization
-    _add_authorization(headers, config, get_oauth_manager())
+    _add_authorization(headers, config, app_cfg.get('OAUTH_MANAGER'))
+
+    session = app_cfg['HTTP_SESSION']
 
     try:
         if is_streaming:
             return _handle_streaming(
-                target_url, openai_request, headers, original_model,
+                session, target_url, openai_request, headers, original_model,
                 anthropic_request, start_time, config, log_manager
             )
         else:
             return _handle_non_streaming(
-                target_url, openai_request, headers, original_model,
+                session, target_url, openai_request, headers, original_model,
                 anthropic_request, start_time, config, log_manager
             )
     except requests.exceptions.Timeout:
         error = {'type': 'error', 'error': {'type': 'overloaded_error', 'message': 'Request timed out'}}
         duration_ms = int((time.time() - start_time) * 1000)
         log_manager.log_api_call('POST', '/v1/messages', 529, duration_ms, anthropic_request, error)
-        return jsonify(error), 529
+        return _json_response(error, 529)
     except requests.exceptions.ConnectionError as e:
         error = {'type': 'error', 'error': {'type': 'api_error', 'message': f'Connection error: {e}'}}
         duration_ms = int((time.time() - start_time) * 1000)
         log_manager.log_api_call('POST', '/v1/messages', 502, duration_ms, anthropic_request, error)
-        return jsonify(error), 502
+        return _json_response(error, 502)
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
         error = {'type': 'error', 'error': {'type': 'api_error', 'message': f'Internal error: {e}'}}
         duration_ms = int((time.time() - start_time) * 1000)
         log_manager.log_api_call('POST', '/v1/messages', 500, duration_ms, anthropic_request, error)
-        return jsonify(error), 500
+        return _json_response(error, 500)
 
 
 def _add_authorization(headers: dict, config, oauth_manager):
@@ -177,7 +250,7 @@ def _add_authorization(headers: dict, config, oauth_manager):
                 logger.debug("Using OAuth token")
                 return
         except Exception as e:
-            logger.error(f"Failed to get OAuth token: {e}")
+            logger.error("Failed to get OAuth token: %s", e)
 
     # Priority 2: Static API key
     if config.is_api_key_configured():
@@ -188,15 +261,15 @@ def _add_authorization(headers: dict, config, oauth_manager):
     logger.warning("No authentication configured for target endpoint")
 
 
-def _handle_non_streaming(target_url, openai_request, headers, original_model,
+def _handle_non_streaming(session, target_url, openai_request, headers, original_model,
                           anthropic_request, start_time, config, log_manager):
     """Handle non-streaming request/response."""
-    response = requests.post(
+    # SSL verification comes from session.verify, resolved once at startup
+    response = session.post(
         target_url,
         json=openai_request,
         headers=headers,
-        timeout=120,
-        verify=config.get_verify_ssl()
+        timeout=120
     )
 
     duration_ms = int((time.time() - start_time) * 1000)
@@ -210,15 +283,16 @@ def _handle_non_streaming(target_url, openai_request, headers, original_model,
         anthropic_error = translate_error(error_data, response.status_code)
         log_manager.log_api_call('POST', '/v1/messages', response.status_code, duration_ms,
                                 anthropic_request, anthropic_error)
-        return jsonify(anthropic_error), response.status_code
+        return _json_response(anthropic_error, response.status_code)
 
-    # Parse and translate response
+    # Parse and translate response - parse the raw bytes directly rather
+    # than materializing an intermediate str via response.json()
     try:
-        openai_response = response.json()
+        openai_response = _json_loads(response.content)
     except Exception as e:
         error = {'type': 'error', 'error': {'type': 'api_error', 'message': f'Invalid JSON from target: {e}'}}
         log_manager.log_api_call('POST', '/v1/messages', 502, duration_ms, anthropic_request, error)
-        return jsonify(error), 502
+        return _json_response(error, 502)
 
     anthropic_response = translate_response(openai_response, original_model)
 
@@ -232,54 +306,55 @@ def _handle_non_streaming(target_url, openai_request, headers, original_model,
                             output_tokens=output_tokens,
                             cost_usd=cost)
 
-    logger.info(f"<- stop_reason={anthropic_response.get('stop_reason')} | "
-                f"tokens={input_tokens}+{output_tokens} | cost=${cost:.4f}")
+    logger.info("<- stop_reason=%s | tokens=%d+%d | cost=$%.4f",
+                anthropic_response.get('stop_reason'), input_tokens, output_tokens, cost)
 
-    return jsonify(anthropic_response), 200
+    return _json_response(anthropic_response, 200)
 
 
-def _handle_streaming(target_url, openai_request, headers, original_model,
+def _handle_streaming(session, target_url, openai_request, headers, original_model,
                       anthropic_request, start_time, config, log_manager):
     """Handle streaming request/response."""
     import threading
     import queue
 
-    logger.info(f"Sending streaming request to {target_url}")
+    logger.info("Sending streaming request to %s", target_url)
 
     try:
-        response = requests.post(
+        # SSL verification comes from session.verify, resolved once at startup
+        response = session.post(
             target_url,
             json=openai_request,
             headers=headers,
             timeout=600,
-            stream=True,
-            verify=config.get_verify_ssl()
+            stream=True
         )
     except Exception as e:
         import traceback
-        logger.error(f"Failed to connect to target: {e}")
+        logger.error("Failed to connect to target: %s", e)
         logger.error(traceback.format_exc())
         raise
 
-    logger.info(f"Target response status: {response.status_code}")
+    logger.info("Target response status: %s", response.status_code)
 
     if not response.ok:
         duration_ms = int((time.time() - start_time) * 1000)
         try:
             error_text = response.text
-            logger.error(f"Target error response: {error_text[:1000]}")
+            logger.error("Target error response: %s", error_text[:1000])
             error_data = response.json()
         except:
             error_data = {'error': {'message': response.text or 'Unknown error'}}
 
-        logger.error(f"Target error data: {error_data}")
+        logger.error("Target error data: %s", error_data)
         anthropic_error = translate_error(error_data, response.status_code)
         log_manager.log_api_call('POST', '/v1/messages', response.status_code, duration_ms,
                                 anthropic_request, anthropic_error)
-        return jsonify(anthropic_error), response.status_code
+        return _json_response(anthropic_error, response.status_code)
 
-    # Stream translator - will emit early events
-    translator = StreamTranslator(original_model)
+    # Stream translator - will emit early events; pooled so back-to-back
+    # streams reuse the state object
+    translator = acquire_translator(original_model)
 
     def generate():
         chunk_count = 0
@@ -298,38 +373,90 @@ def _handle_streaming(target_url, openai_request, headers, original_model,
 
         ping_thread = threading.Thread(target=ping_sender, daemon=True)
 
+        # Coalesce small events into fewer WSGI yields - each yield is a
+        # round-trip through the server's write path, so batch up to ~4 KiB
+        # or 10 ms, whichever comes first, without ever splitting an event
+        out = bytearray()
+        last_flush = time.monotonic()
+
         try:
             # Emit message_start and content_block_start IMMEDIATELY
             # This prevents Claude Code from timing out while waiting for OpenAI
             early_events = translator.emit_early_stream_start()
             for event in early_events:
-                yield event.encode('utf-8')
+                out += event
+            yield bytes(out)
+            out.clear()
 
             # Start sending pings while we wait for content
             ping_thread.start()
 
-            for chunk in response.iter_lines():
+            # Read raw byte chunks and split on the SSE event delimiter
+            # ourselves - iter_lines decodes and re-splits every chunk at
+            # Python level, which dominates CPU on fast token streams
+            buf = bytearray()
+            for raw in response.raw.stream(16384, decode_content=True):
                 # Check for pending pings and yield them
                 while not ping_queue.empty():
                     try:
-                        ping = ping_queue.get_nowait()
-                        yield ping
+                        yield ping_queue.get_nowait()
                     except queue.Empty:
                         break
 
-                if chunk:
+                if not raw:
+                    continue
+
+                buf += raw
+                while True:
+                    # SSE permits either line ending, so split on LF-LF
+                    # or CRLF-CRLF, whichever comes first (the translator
+                    # strips any stray \r from the event itself)
+                    sep = buf.find(b'\n\n')
+                    sep_len = 2
+                    crlf_sep = buf.find(b'\r\n\r\n')
+                    if crlf_sep != -1 and (sep < 0 or crlf_sep < sep):
+                        sep = crlf_sep
+                        sep_len = 4
+                    if sep < 0:
+                        break
+                    event_bytes = bytes(buf[:sep])
+                    del buf[:sep + sep_len]
+
+                    if not event_bytes:
+                        continue
+
                     chunk_count += 1
                     content_started = True
                     stop_pings.set()  # Stop ping sender once content arrives
 
-                    # Log first few chunks for debugging
+                    # Log first few events for debugging
                     if chunk_count <= 3:
-                        logger.debug(f"Received chunk {chunk_count}: {chunk[:200]}")
+                        logger.debug("Received event %d: %s", chunk_count, event_bytes[:200])
 
                     # Translate OpenAI chunk to Anthropic events
-                    events = translator.translate_chunk(chunk)
-                    for event in events:
-                        yield event.encode('utf-8')
+                    out += translator.translate_chunk(event_bytes)
+
+                    now = time.monotonic()
+                    if len(out) >= 4096 or now - last_flush > 0.01:
+                        if out:
+                            yield bytes(out)
+                            out.clear()
+                        last_flush = now
+
+                # This network chunk is fully drained - flush whatever
+                # is pending before blocking on the next upstream read,
+                # so an upstream pause never sits on translated tokens
+                if out:
+                    yield bytes(out)
+                    out.clear()
+                    last_flush = time.monotonic()
+
+            # Flush any trailing event without a closing delimiter
+            if buf.strip():
+                out += translator.translate_chunk(bytes(buf))
+            if out:
+                yield bytes(out)
+                out.clear()
 
             # Stop pings and log completion with cost
             stop_pings.set()
@@ -344,18 +471,17 @@ def _handle_streaming(target_url, openai_request, headers, original_model,
                                     output_tokens=output_tokens,
                                     cost_usd=cost)
 
-            logger.info(f"<- stream complete | tokens={input_tokens}+{output_tokens} | cost=${cost:.4f}")
+            logger.info("<- stream complete | tokens=%d+%d | cost=$%.4f", input_tokens, output_tokens, cost)
 
         except GeneratorExit:
             # This is normal - Claude Code may disconnect streams it no longer needs
             stop_pings.set()
             logger.debug("Client disconnected during stream (normal if parallel requests)")
         except Exception as e:
-            import json
             import traceback
             stop_pings.set()
             tb = traceback.format_exc()
-            logger.error(f"Streaming error: {e}")
+            logger.error("Streaming error: %s", e)
             logger.error(tb)
             # Log the error to dashboard
             duration_ms = int((time.time() - start_time) * 1000)
@@ -369,15 +495,19 @@ def _handle_streaming(target_url, openai_request, headers, original_model,
             }
             log_manager.log_api_call('POST', '/v1/messages', 500, duration_ms,
                                     anthropic_request, error_data)
-            error_event = f"event: error\ndata: {json.dumps(error_data)}\n\n"
-            yield error_event.encode('utf-8')
+            yield b'event: error\ndata: ' + _json_dumps_bytes(error_data) + b'\n\n'
         finally:
             stop_pings.set()
             response.close()
+            release_translator(translator)
 
+    # generate() only touches captured locals, so the request context
+    # doesn't need to be kept alive per tick; direct_passthrough hands
+    # the byte chunks straight to the server without response buffering
     return Response(
-        stream_with_context(generate()),
+        generate(),
         content_type='text/event-stream',
+        direct_passthrough=True,
         headers={
             'Cache-Control': 'no-cache',
             'X-Accel-Buffering': 'no',
@@ -389,8 +519,7 @@ def _handle_streaming(target_url, openai_request, headers, original_model,
 def _handle_placeholder_stream(original_model, anthropic_request, start_time, log_manager, config):
     """Handle placeholder streaming response."""
     def generate():
-        for event in generate_placeholder_stream(original_model):
-            yield event.encode('utf-8')
+        yield from _placeholder_frames(original_model)
 
         duration_ms = int((time.time() - start_time) * 1000)
         cost = config.calculate_cost(original_model, 100, 20)
@@ -399,8 +528,9 @@ def _handle_placeholder_stream(original_model, anthropic_request, start_time, lo
                                 input_tokens=100, output_tokens=20, cost_usd=cost)
 
     return Response(
-        stream_with_context(generate()),
+        generate(),
         content_type='text/event-stream',
+        direct_passthrough=True,
         headers={
             'Cache-Control': 'no-cache',
             'X-Accel-Buffering': 'no',
@@ -1,7 +1,10 @@
 """Request/response logging and usage tracking for cc-launcher."""
 
 import time
+import queue
 import logging
+import threading
+from itertools import islice
 from typing import Any, Dict, List, Optional
 from collections import deque
 from dataclasses import dataclass, field
@@ -38,16 +41,23 @@ class UsageStats:
         return time.time() - self.session_start
 
     def to_dict(self) -> dict:
+        # Inline the derived values rather than going through the
+        # properties - this is polled by the dashboard, and the property
+        # dispatch plus repeated attribute loads add up at poll rate
+        total = self.total_requests
+        successful = self.successful_requests
+        input_tokens = self.total_input_tokens
+        output_tokens = self.total_output_tokens
         return {
-            'total_requests': self.total_requests,
-            'successful_requests': self.successful_requests,
+            'total_requests': total,
+            'successful_requests': successful,
             'failed_requests': self.failed_requests,
-            'success_rate': round(self.success_rate, 1),
-            'total_input_tokens': self.total_input_tokens,
-            'total_output_tokens': self.total_output_tokens,
-            'total_tokens': self.total_input_tokens + self.total_output_tokens,
-            'avg_latency_ms': round(self.avg_latency_ms, 0),
-            'session_duration_seconds': round(self.session_duration_seconds, 0),
+            'success_rate': round((successful / total) * 100, 1) if total else 100.0,
+            'total_input_tokens': input_tokens,
+            'total_output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens,
+            'avg_latency_ms': round(self.total_latency_ms / successful, 0) if successful else 0.0,
+            'session_duration_seconds': round(time.time() - self.session_start, 0),
             'total_cost_usd': round(self.total_cost_usd, 4),
         }
 
@@ -60,6 +70,16 @@ class LoggerManager:
         self.api_calls: deque = deque(maxlen=max_logs)
         self.server_events: deque = deque(maxlen=max_logs)
         self.usage = UsageStats()
+        # When disabled (headless/no dashboard attached), request and
+        # response bodies are dropped and only the stat counters run
+        self.detailed_logging = True
+
+        # API-call records are enqueued by request threads and drained by
+        # a single background worker, so request latency never depends on
+        # how expensive recording (sanitizing, stats) happens to be
+        self._api_call_queue: queue.Queue = queue.Queue(maxsize=10_000)
+        self._worker = threading.Thread(target=self._drain_api_calls, daemon=True)
+        self._worker.start()
 
     def log_api_call(
         self,
@@ -73,15 +93,58 @@ class LoggerManager:
         output_tokens: int = 0,
         cost_usd: float = 0.0
     ):
-        """Log an API call with optional request/response data."""
+        """Queue an API call record for the background worker (non-blocking)."""
+        record = (method, path, status, duration_ms, request_data, response_data,
+                  input_tokens, output_tokens, cost_usd)
+        try:
+            self._api_call_queue.put_nowait(record)
+        except queue.Full:
+            # Drop the oldest record rather than stalling the request path
+            try:
+                self._api_call_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._api_call_queue.put_nowait(record)
+            except queue.Full:
+                pass
+
+    def _drain_api_calls(self):
+        """Background worker: record queued API calls."""
+        while True:
+            record = self._api_call_queue.get()
+            try:
+                self._record_api_call(*record)
+            except Exception:
+                logger.exception("Failed to record API call")
+
+    def _record_api_call(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        duration_ms: int,
+        request_data: Optional[Dict] = None,
+        response_data: Optional[Dict] = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cost_usd: float = 0.0
+    ):
+        """Record an API call with optional request/response data."""
+        if not self.detailed_logging:
+            request_data = None
+            response_data = None
+
         entry = {
             'timestamp': time.time(),
             'method': method,
             'path': path,
             'status': status,
             'duration_ms': duration_ms,
-            'request': self._sanitize_for_log(request_data),
-            'response': self._sanitize_for_log(response_data),
+            # Stored raw; sanitization happens lazily in get_api_calls,
+            # so entries that rotate out of the deque unread cost nothing
+            'request': request_data,
+            'response': response_data,
             'input_tokens': input_tokens,
             'output_tokens': output_tokens,
             'cost_usd': cost_usd,
@@ -107,6 +170,11 @@ class LoggerManager:
             token_info = f" | tokens: {input_tokens}+{output_tokens}" + (f" ({cost_str})" if cost_str else "")
         logger.info(f"{method} {path} -> {status} ({duration_ms}ms){token_info}")
 
+    def enable_detailed_logging(self, enabled: bool):
+        """Toggle retention of request/response bodies at runtime."""
+        self.detailed_logging = enabled
+        logger.info("Detailed logging %s", "enabled" if enabled else "disabled")
+
     def log_server_event(self, level: str, message: str, data: Optional[Dict] = None):
         """Log a server event."""
         entry = {
@@ -123,12 +191,22 @@ class LoggerManager:
         log_func(message)
 
     def get_api_calls(self, limit: int = 50) -> List[Dict]:
-        """Get recent API calls."""
-        return list(self.api_calls)[:limit]
+        """Get recent API calls (content truncation applied on read)."""
+        sanitize = self._sanitize_for_log
+        calls = []
+        # appendleft keeps newest first, so left iteration + islice reads
+        # just the requested window instead of materializing the deque
+        for entry in islice(self.api_calls, limit):
+            request_data = sanitize(entry['request'])
+            response_data = sanitize(entry['response'])
+            if request_data is not entry['request'] or response_data is not entry['response']:
+                entry = {**entry, 'request': request_data, 'response': response_data}
+            calls.append(entry)
+        return calls
 
     def get_server_events(self, limit: int = 50) -> List[Dict]:
         """Get recent server events."""
-        return list(self.server_events)[:limit]
+        return list(islice(self.server_events, limit))
 
     def get_usage_stats(self) -> Dict:
         """Get current usage statistics."""
@@ -145,34 +223,97 @@ class LoggerManager:
         self.usage = UsageStats()
         logger.info("Usage statistics reset")
 
+    # Only the most recent messages are interesting for debugging, so
+    # they alone get per-block truncation; older ones are elided in O(1)
+    # apiece, keeping the guarantee that nothing large ships to the
+    # dashboard without scaling the scan with conversation length
+    MAX_SANITIZE_MESSAGES = 20
+
+    @staticmethod
+    def _truncate(text: str) -> str:
+        return text[:500] + '... [truncated]'
+
+    def _sanitize_blocks(self, blocks: list) -> list:
+        """Truncate long text blocks, copying only the blocks that change."""
+        out = blocks
+        for i, block in enumerate(blocks):
+            if isinstance(block, dict):
+                text = block.get('text')
+                if isinstance(text, str) and len(text) > 500:
+                    if out is blocks:
+                        out = list(blocks)
+                    out[i] = {**block, 'text': self._truncate(text)}
+        return out
+
     def _sanitize_for_log(self, data: Optional[Dict]) -> Optional[Dict]:
-        """Sanitize data for logging (truncate large content)."""
+        """
+        Sanitize data for logging (truncate large content).
+
+        Copy-on-truncate: when nothing exceeds the limit the original
+        mapping is returned as-is, and otherwise only the outer dict and
+        the specific messages/blocks being rewritten are shallow-copied.
+        Logged data is treated as read-only downstream, so sharing the
+        untouched structure is safe and skips a deep copy of the full
+        chat history on every request.
+        """
         if data is None:
             return None
 
-        # Deep copy to avoid modifying original
-        import copy
-        sanitized = copy.deepcopy(data)
+        # Logged bodies aren't guaranteed well-formed: a rejected
+        # request is recorded as whatever the client posted, and since
+        # sanitization runs lazily on the read path, raising here would
+        # poison every /api/logs poll until the entry rotates out. Skip
+        # shapes we don't recognize instead.
+        if not isinstance(data, dict):
+            return data
+
+        sanitized = data
 
         # Truncate message content if too long
-        if 'messages' in sanitized:
-            for msg in sanitized['messages']:
-                if isinstance(msg.get('content'), str) and len(msg['content']) > 500:
-                    msg['content'] = msg['content'][:500] + '... [truncated]'
-                elif isinstance(msg.get('content'), list):
-                    for block in msg['content']:
-                        if isinstance(block, dict):
-                            if isinstance(block.get('text'), str) and len(block['text']) > 500:
-                                block['text'] = block['text'][:500] + '... [truncated]'
+        messages = data.get('messages')
+        if isinstance(messages, list):
+            new_messages = None
+            start = max(len(messages) - self.MAX_SANITIZE_MESSAGES, 0)
+            for i, msg in enumerate(messages):
+                if not isinstance(msg, dict):
+                    continue
+                content = msg.get('content')
+                replacement = None
+                if isinstance(content, str):
+                    if len(content) > 500:
+                        replacement = self._truncate(content)
+                elif isinstance(content, list):
+                    if i < start:
+                        # Outside the recent window: elide the blocks
+                        # outright instead of scanning them
+                        if content:
+                            replacement = [{
+                                'type': 'text',
+                                'text': f'[{len(content)} content blocks elided]'
+                            }]
+                    else:
+                        new_blocks = self._sanitize_blocks(content)
+                        if new_blocks is not content:
+                            replacement = new_blocks
+                if replacement is not None:
+                    if new_messages is None:
+                        new_messages = list(messages)
+                    new_messages[i] = {**msg, 'content': replacement}
+            if new_messages is not None:
+                sanitized = dict(data)
+                sanitized['messages'] = new_messages
 
         # Truncate response content
-        if 'content' in sanitized:
-            if isinstance(sanitized['content'], str) and len(sanitized['content']) > 500:
-                sanitized['content'] = sanitized['content'][:500] + '... [truncated]'
-            elif isinstance(sanitized['content'], list):
-                for block in sanitized['content']:
-                    if isinstance(block, dict):
-                        if isinstance(block.get('text'), str) and len(block['text']) > 500:
-                            block['text'] = block['text'][:500] + '... [truncated]'
+        content = data.get('content')
+        if isinstance(content, str) and len(content) > 500:
+            if sanitized is data:
+                sanitized = dict(data)
+            sanitized['content'] = self._truncate(content)
+        elif isinstance(content, list):
+            new_blocks = self._sanitize_blocks(content)
+            if new_blocks is not content:
+                if sanitized is data:
+                    sanitized = dict(data)
+                sanitized['content'] = new_blocks
 
         return sanitized
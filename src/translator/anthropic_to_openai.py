@@ -1,10 +1,24 @@
 """Translate Anthropic API requests to OpenAI format."""
 
+import json
 import logging
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# OpenAI's schema wants tool arguments as a str, so decode orjson's
+# bytes once; stdlib json is the fallback
+if orjson is not None:
+    def _dumps_args(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _dumps_args = json.dumps
+
 
 def translate_request(
     anthropic_request: Dict[str, Any],
@@ -38,23 +52,19 @@ def translate_request(
         if isinstance(system_prompt, str):
             messages.append({'role': 'system', 'content': system_prompt})
         elif isinstance(system_prompt, list):
-            # Anthropic supports array of content blocks for system
-            system_text = ' '.join(
-                block.get('text', '') for block in system_prompt
-                if block.get('type') == 'text'
-            )
-            if system_text:
-                messages.append({'role': 'system', 'content': system_text})
-
-    # Translate messages
+            # Anthropic supports array of content blocks for system;
+            # skip empty blocks so the join doesn't produce stray spaces
+            parts = [
+                block['text'] for block in system_prompt
+                if isinstance(block, dict) and block.get('type') == 'text' and block.get('text')
+            ]
+            if parts:
+                messages.append({'role': 'system', 'content': ' '.join(parts)})
+
+    # Translate messages - handlers append straight into the output list
+    # (a user message with embedded tool_results contributes several)
     for msg in anthropic_request.get('messages', []):
-        translated = _translate_message(msg)
-        if translated:
-            # _translate_message can return a list (e.g., user message with embedded tool_results)
-            if isinstance(translated, list):
-                messages.extend(translated)
-            else:
-                messages.append(translated)
+        _translate_message(msg, messages)
 
     openai_request['messages'] = messages
 
@@ -94,105 +104,127 @@ def translate_request(
     return openai_request
 
 
-def _translate_message(msg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Translate a single message from Anthropic to OpenAI format."""
-    role = msg.get('role')
-    content = msg.get('content')
+def _translate_message(msg: Dict[str, Any], out: list) -> None:
+    """Translate a single message from Anthropic to OpenAI format into out."""
+    handler = _ROLE_DISPATCH.get(msg.get('role'))
+    if handler is not None:
+        handler(msg, out)
+    else:
+        logger.warning("Unknown message role: %s", msg.get('role'))
+
+
+def _translate_assistant_into(msg: Dict[str, Any], out: list) -> None:
+    out.append(_translate_assistant_message(msg))
+
+
+def _translate_tool_result_into(msg: Dict[str, Any], out: list) -> None:
+    # Anthropic tool_result -> OpenAI tool role
+    out.append(_translate_tool_result(msg))
+
+
+def _user_tool_result_block(block: Dict[str, Any]) -> Dict[str, Any]:
+    """tool_result block -> separate OpenAI tool message."""
+    tool_content = block.get('content', '')
+
+    # Content can be string or array of content blocks; tool results are
+    # usually a single text block, so skip the join for that shape
+    if isinstance(tool_content, list):
+        if len(tool_content) == 1 and isinstance(tool_content[0], dict) \
+                and tool_content[0].get('type') == 'text':
+            tool_content = tool_content[0].get('text', '')
+        else:
+            tool_content = ' '.join([
+                b['text'] for b in tool_content
+                if isinstance(b, dict) and b.get('type') == 'text' and b.get('text')
+            ])
+
+    return {
+        'role': 'tool',
+        'tool_call_id': block.get('tool_use_id', ''),
+        'content': f"Error: {tool_content}" if block.get('is_error', False) else str(tool_content)
+    }
+
+
+def _user_text_block(block: Dict[str, Any]) -> Dict[str, Any]:
+    """text block -> OpenAI text content part."""
+    return {'type': 'text', 'text': block.get('text', '')}
 
-    if role == 'user':
-        return _translate_user_message(msg)
-    elif role == 'assistant':
-        return _translate_assistant_message(msg)
-    elif role == 'tool_result':
-        # Anthropic tool_result -> OpenAI tool role
-        return _translate_tool_result(msg)
 
-    logger.warning(f"Unknown message role: {role}")
-    return None
+def _user_image_block(block: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """image block (Anthropic base64 format) -> OpenAI image_url part."""
+    source = block.get('source', {})
+    if source.get('type') != 'base64':
+        return None
+    return {
+        'type': 'image_url',
+        'image_url': {
+            'url': f"data:{source.get('media_type', 'image/png')};base64,{source.get('data', '')}"
+        }
+    }
+
 
+# Dispatch table: block type -> (goes to tool_results, handler). One dict
+# hit per block replaces the chain of type comparisons in the loop.
+_USER_BLOCK_HANDLERS = {
+    'tool_result': (True, _user_tool_result_block),
+    'text': (False, _user_text_block),
+    'image': (False, _user_image_block),
+}
 
-def _translate_user_message(msg: Dict[str, Any]) -> Any:
+
+def _translate_user_message(msg: Dict[str, Any], out: list) -> None:
     """
-    Translate a user message.
+    Translate a user message, appending into out.
 
-    Returns either a single message dict or a list of messages
-    (when tool_results are embedded and need to be extracted as separate tool messages).
+    May contribute several messages: embedded tool_results become
+    separate OpenAI tool messages, emitted before the user message
+    (they respond to the previous assistant's tool_calls).
     """
     content = msg.get('content')
 
     # Simple string content
     if isinstance(content, str):
-        return {'role': 'user', 'content': content}
+        out.append({'role': 'user', 'content': content})
+        return
 
     # Content blocks array
     if isinstance(content, list):
-        # Separate tool_results from other content
-        tool_results = []
+        # Tool messages go straight into out; other content is gathered
+        # into the trailing user message
+        before = len(out)
         other_content = []
+        tool_append = out.append
+        oc_append = other_content.append
+        handlers = _USER_BLOCK_HANDLERS
 
         for block in content:
             if not isinstance(block, dict):
                 continue
 
-            if block.get('type') == 'tool_result':
-                # Extract tool_result as separate OpenAI tool message
-                tool_use_id = block.get('tool_use_id', '')
-                tool_content = block.get('content', '')
-                is_error = block.get('is_error', False)
-
-                # Content can be string or array of content blocks
-                if isinstance(tool_content, list):
-                    tool_content = ' '.join(
-                        b.get('text', '') for b in tool_content
-                        if isinstance(b, dict) and b.get('type') == 'text'
-                    )
-
-                tool_results.append({
-                    'role': 'tool',
-                    'tool_call_id': tool_use_id,
-                    'content': str(tool_content) if not is_error else f"Error: {tool_content}"
-                })
-            elif block.get('type') == 'text':
-                other_content.append({
-                    'type': 'text',
-                    'text': block.get('text', '')
-                })
-            elif block.get('type') == 'image':
-                # Anthropic image format
-                source = block.get('source', {})
-                if source.get('type') == 'base64':
-                    other_content.append({
-                        'type': 'image_url',
-                        'image_url': {
-                            'url': f"data:{source.get('media_type', 'image/png')};base64,{source.get('data', '')}"
-                        }
-                    })
-
-        # Build result: tool messages first (they respond to previous assistant's tool_calls),
-        # then user message with remaining content
-        result = []
-
-        # Add tool result messages first
-        result.extend(tool_results)
+            entry = handlers.get(block.get('type'))
+            if entry is None:
+                continue
+
+            is_tool_result, handler = entry
+            translated = handler(block)
+            if translated is None:
+                continue
+            (tool_append if is_tool_result else oc_append)(translated)
 
         # Add user message if there's non-tool content
         if other_content:
             if len(other_content) == 1 and other_content[0].get('type') == 'text':
                 # Simple text content
-                result.append({'role': 'user', 'content': other_content[0].get('text', '')})
+                out.append({'role': 'user', 'content': other_content[0].get('text', '')})
             else:
                 # Mixed content array
-                result.append({'role': 'user', 'content': other_content})
+                out.append({'role': 'user', 'content': other_content})
+        elif len(out) == before:
+            # Nothing translatable at all - keep an empty user turn
+            out.append({'role': 'user', 'content': ''})
+        return
 
-        # Return single message or list
-        if len(result) == 1:
-            return result[0]
-        elif len(result) > 1:
-            return result
-        else:
-            return {'role': 'user', 'content': ''}
-
-    return {'role': 'user', 'content': str(content)}
+    out.append({'role': 'user', 'content': str(content)})
 
 
 def _translate_assistant_message(msg: Dict[str, Any]) -> Dict[str, Any]:
@@ -209,6 +241,7 @@ def _translate_assistant_message(msg: Dict[str, Any]) -> Dict[str, Any]:
     if isinstance(content, list):
         text_parts = []
         tool_calls = []
+        _dumps = _dumps_args
 
         for i, block in enumerate(content):
             if not isinstance(block, dict):
@@ -218,13 +251,12 @@ def _translate_assistant_message(msg: Dict[str, Any]) -> Dict[str, Any]:
                 text_parts.append(block.get('text', ''))
             elif block.get('type') == 'tool_use':
                 # Anthropic tool_use -> OpenAI tool_calls
-                import json
                 tool_calls.append({
                     'id': block.get('id', f'call_{i}'),
                     'type': 'function',
                     'function': {
                         'name': block.get('name', ''),
-                        'arguments': json.dumps(block.get('input', {}))
+                        'arguments': _dumps(block.get('input', {}))
                     }
                 })
 
@@ -247,12 +279,17 @@ def _translate_tool_result(msg: Dict[str, Any]) -> Dict[str, Any]:
     tool_use_id = msg.get('tool_use_id', '')
     content = msg.get('content', '')
 
-    # Content can be string or content blocks
+    # Content can be string or content blocks; single text blocks skip
+    # the join entirely
     if isinstance(content, list):
-        content = ' '.join(
-            block.get('text', '') for block in content
-            if isinstance(block, dict) and block.get('type') == 'text'
-        )
+        if len(content) == 1 and isinstance(content[0], dict) \
+                and content[0].get('type') == 'text':
+            content = content[0].get('text', '')
+        else:
+            content = ' '.join([
+                block['text'] for block in content
+                if isinstance(block, dict) and block.get('type') == 'text' and block.get('text')
+            ])
 
     return {
         'role': 'tool',
@@ -261,6 +298,15 @@ def _translate_tool_result(msg: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Role dispatch for _translate_message - one dict hit per message
+# instead of a chain of string comparisons
+_ROLE_DISPATCH = {
+    'user': _translate_user_message,
+    'assistant': _translate_assistant_into,
+    'tool_result': _translate_tool_result_into,
+}
+
+
 def _translate_tools(anthropic_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Translate Anthropic tools to OpenAI functions format."""
     openai_tools = []
@@ -279,6 +325,11 @@ def _translate_tools(anthropic_tools: List[Dict[str, Any]]) -> List[Dict[str, An
     return openai_tools
 
 
+# Anthropic tool_choice values -> OpenAI equivalents (used for both the
+# plain-string form and the {'type': ...} form)
+_STR_TOOL_CHOICE = {'auto': 'auto', 'any': 'required', 'none': 'none'}
+
+
 def _translate_tool_choice(anthropic_choice: Any) -> Any:
     """Translate Anthropic tool_choice to OpenAI format."""
     if anthropic_choice is None:
@@ -286,23 +337,15 @@ def _translate_tool_choice(anthropic_choice: Any) -> Any:
 
     if isinstance(anthropic_choice, str):
         # Direct string values
-        if anthropic_choice == 'auto':
-            return 'auto'
-        elif anthropic_choice == 'any':
-            return 'required'
-        elif anthropic_choice == 'none':
-            return 'none'
+        return _STR_TOOL_CHOICE.get(anthropic_choice, 'auto')
 
     if isinstance(anthropic_choice, dict):
         choice_type = anthropic_choice.get('type')
 
-        if choice_type == 'auto':
-            return 'auto'
-        elif choice_type == 'any':
-            return 'required'
-        elif choice_type == 'none':
-            return 'none'
-        elif choice_type == 'tool':
+        mapped = _STR_TOOL_CHOICE.get(choice_type)
+        if mapped is not None:
+            return mapped
+        if choice_type == 'tool':
             # Specific tool
             return {
                 'type': 'function',
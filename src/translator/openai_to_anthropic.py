@@ -1,12 +1,62 @@
 """Translate OpenAI API responses to Anthropic format."""
 
+import os
+import json
 import logging
-import uuid
 import time
 from typing import Dict, Any, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Tool-call arguments are parsed once per tool_use block; orjson's C
+# parser when available, stdlib json otherwise
+if orjson is not None:
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+else:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# OpenAI finish_reason -> Anthropic stop_reason. Allocated once here
+# rather than per call; the streaming translator shares it.
+_FINISH_REASON_MAP = {
+    'stop': 'end_turn',
+    'length': 'max_tokens',
+    'tool_calls': 'tool_use',
+    'content_filter': 'end_turn',  # No direct equivalent
+    'function_call': 'tool_use',  # Legacy function calling
+}
+
+# OpenAI error types -> Anthropic error types
+_ERROR_TYPE_MAP = {
+    'invalid_request_error': 'invalid_request_error',
+    'authentication_error': 'authentication_error',
+    'permission_error': 'permission_error',
+    'not_found_error': 'not_found_error',
+    'rate_limit_error': 'rate_limit_error',
+    'server_error': 'api_error',
+    'timeout': 'overloaded_error',
+}
+
+# Message/tool-use IDs are 24 hex chars. uuid4() costs a 16-byte
+# os.urandom syscall (plus UUID object construction) per ID, so instead
+# draw entropy in one batch and slice it - 12 random bytes per ID, one
+# syscall per 256 IDs. Shared with the streaming translator.
+_ID_POOL: list = []
+
+
+def _new_id24() -> str:
+    """Return 24 hex chars of fresh randomness from the batched pool."""
+    if not _ID_POOL:
+        raw = os.urandom(12 * 256)
+        _ID_POOL.extend(raw[i:i + 12].hex() for i in range(0, len(raw), 12))
+    return _ID_POOL.pop()
+
 
 def translate_response(
     openai_response: Dict[str, Any],
@@ -23,7 +73,7 @@ def translate_response(
         Anthropic-compatible response body
     """
     # Generate Anthropic-style message ID
-    msg_id = f"msg_{uuid.uuid4().hex[:24]}"
+    msg_id = f"msg_{_new_id24()}"
 
     anthropic_response = {
         'id': msg_id,
@@ -50,39 +100,47 @@ def translate_response(
     finish_reason = choice.get('finish_reason')
 
     # Translate content
-    content_blocks = []
-
-    # Text content
     text_content = message.get('content')
-    if text_content:
-        content_blocks.append({
-            'type': 'text',
-            'text': text_content
-        })
-
-    # Tool calls -> tool_use blocks
-    tool_calls = message.get('tool_calls', [])
-    for tc in tool_calls:
-        if tc.get('type') == 'function':
-            func = tc.get('function', {})
-            # Parse arguments JSON
-            import json
-            try:
-                args = json.loads(func.get('arguments', '{}'))
-            except json.JSONDecodeError:
-                args = {'raw': func.get('arguments', '')}
-
+    tool_calls = message.get('tool_calls')
+
+    if not tool_calls:
+        # Common case: text-only (or empty) response - build the content
+        # list in one shot instead of append-by-append
+        anthropic_response['content'] = (
+            [{'type': 'text', 'text': text_content}] if text_content else []
+        )
+    else:
+        content_blocks = []
+
+        # Text content
+        if text_content:
             content_blocks.append({
-                'type': 'tool_use',
-                'id': tc.get('id', f'toolu_{uuid.uuid4().hex[:24]}'),
-                'name': func.get('name', ''),
-                'input': args
+                'type': 'text',
+                'text': text_content
             })
 
-    anthropic_response['content'] = content_blocks
+        # Tool calls -> tool_use blocks
+        for tc in tool_calls:
+            if tc.get('type') == 'function':
+                func = tc.get('function', {})
+                # Parse arguments JSON
+                try:
+                    args = _loads(func.get('arguments', '{}'))
+                except _JSONDecodeError:
+                    args = {'raw': func.get('arguments', '')}
+
+                content_blocks.append({
+                    'type': 'tool_use',
+                    'id': tc.get('id', f'toolu_{_new_id24()}'),
+                    'name': func.get('name', ''),
+                    'input': args
+                })
+
+        anthropic_response['content'] = content_blocks
 
     # Translate finish_reason to stop_reason
-    anthropic_response['stop_reason'] = _translate_finish_reason(finish_reason)
+    if finish_reason:
+        anthropic_response['stop_reason'] = _FINISH_REASON_MAP.get(finish_reason, 'end_turn')
 
     # Usage
     usage = openai_response.get('usage', {})
@@ -129,17 +187,6 @@ def translate_error(
             }
         }
 
-    # Map OpenAI error types to Anthropic types
-    error_type_map = {
-        'invalid_request_error': 'invalid_request_error',
-        'authentication_error': 'authentication_error',
-        'permission_error': 'permission_error',
-        'not_found_error': 'not_found_error',
-        'rate_limit_error': 'rate_limit_error',
-        'server_error': 'api_error',
-        'timeout': 'overloaded_error',
-    }
-
     # Try to get error type from various places
     openai_type = (
         error_info.get('type') or
@@ -147,7 +194,7 @@ def translate_error(
         error_response.get('type') or
         'api_error'
     )
-    anthropic_type = error_type_map.get(openai_type, 'api_error')
+    anthropic_type = _ERROR_TYPE_MAP.get(openai_type, 'api_error')
 
     # Try to get error message from various places
     error_message = (
@@ -166,29 +213,13 @@ def translate_error(
     }
 
 
-def _translate_finish_reason(finish_reason: Optional[str]) -> Optional[str]:
-    """Translate OpenAI finish_reason to Anthropic stop_reason."""
-    if not finish_reason:
-        return None
-
-    mapping = {
-        'stop': 'end_turn',
-        'length': 'max_tokens',
-        'tool_calls': 'tool_use',
-        'content_filter': 'end_turn',  # No direct equivalent
-        'function_call': 'tool_use',  # Legacy function calling
-    }
-
-    return mapping.get(finish_reason, 'end_turn')
-
-
 def build_placeholder_response(
     model: str = 'claude-sonnet-4-20250514',
     content: str = 'This is a placeholder response from cc-launcher.'
 ) -> Dict[str, Any]:
     """Build a placeholder Anthropic response for testing."""
     return {
-        'id': f"msg_{uuid.uuid4().hex[:24]}",
+        'id': f"msg_{_new_id24()}",
         'type': 'message',
         'role': 'assistant',
         'model': model,
@@ -2,24 +2,75 @@
 
 import json
 import logging
-import uuid
-import time
 from typing import Dict, Any, List, Optional, Generator
+from collections import deque
 from dataclasses import dataclass, field
 
-logger = logging.getLogger(__name__)
+from .openai_to_anthropic import _new_id24, _FINISH_REASON_MAP
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# JSON encode/decode runs once per streamed token, so prefer orjson's C
+# codec when it's installed; stdlib json is the fallback
+if orjson is not None:
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Static SSE frame scaffolding - emitting an event is one JSON encode
+# plus byte concatenation, with no per-event str formatting or re-encode
+_PREFIX_MESSAGE_START = b'event: message_start\ndata: '
+_PREFIX_BLOCK_START = b'event: content_block_start\ndata: '
+_PREFIX_DELTA = b'event: content_block_delta\ndata: '
+_PREFIX_BLOCK_STOP = b'event: content_block_stop\ndata: '
+_PREFIX_MESSAGE_DELTA = b'event: message_delta\ndata: '
+_PREFIX_ERROR = b'event: error\ndata: '
+_SUFFIX = b'\n\n'
+_MESSAGE_STOP_FRAME = b'event: message_stop\ndata: {"type":"message_stop"}\n\n'
+
+# Byte templates for the highest-frequency frames: only the block index
+# and the payload string vary, so emits splice those into the template
+# (_dumps on the bare string handles JSON escaping) rather than building
+# and serializing a nested dict per token
+_TPL_DELTA_INDEX = _PREFIX_DELTA + b'{"type":"content_block_delta","index":'
+_TPL_TEXT_DELTA = b',"delta":{"type":"text_delta","text":'
+_TPL_JSON_DELTA = b',"delta":{"type":"input_json_delta","partial_json":'
+_TPL_BLOCK_STOP = _PREFIX_BLOCK_STOP + b'{"type":"content_block_stop","index":'
+_TPL_BLOCK_START_TEXT = _PREFIX_BLOCK_START + b'{"type":"content_block_start","index":'
+_TPL_MESSAGE_DELTA = _PREFIX_MESSAGE_DELTA + b'{"type":"message_delta","delta":{"stop_reason":"' 
+
+
+@dataclass(slots=True)
 class StreamState:
-    """Track state during stream translation."""
-    message_id: str = field(default_factory=lambda: f"msg_{uuid.uuid4().hex[:24]}")
+    """
+    Track state during stream translation.
+
+    slots=True drops the per-instance __dict__: one of these is built
+    per request and its fields are read dozens of times per streamed
+    token in translate_chunk.
+    """
+    # Generated on first emit - aborted streams never need one
+    message_id: Optional[str] = None
     model: str = 'claude-sonnet-4-20250514'
     message_started: bool = False
     content_block_started: bool = False
     current_block_index: int = 0
     current_block_type: str = 'text'
-    accumulated_tool_calls: Dict[int, Dict] = field(default_factory=dict)
+    # Dense list indexed by the OpenAI tool-call index (their contract
+    # starts at 0 and counts up), so lookups are list indexing rather
+    # than int-keyed dict hashing
+    accumulated_tool_calls: List[Optional[Dict]] = field(default_factory=list)
     input_tokens: int = 0
     output_tokens: int = 0
     stop_reason: Optional[str] = None
@@ -48,8 +99,29 @@ class StreamTranslator:
 
     def __init__(self, original_model: str = 'claude-sonnet-4-20250514'):
         self.state = StreamState(model=original_model)
-
-    def emit_early_stream_start(self) -> List[str]:
+        self._msg_start_frame: Optional[bytes] = None
+        # Encoded current_block_index, rebuilt only at block boundaries
+        # so the per-token emits skip the int->decimal conversion
+        self._index_bytes = b'0'
+
+    def reset(self, original_model: str = 'claude-sonnet-4-20250514') -> 'StreamTranslator':
+        """Reinitialize for a new stream without reallocating state."""
+        state = self.state
+        state.message_id = None
+        state.model = original_model
+        state.message_started = False
+        state.content_block_started = False
+        state.current_block_index = 0
+        state.current_block_type = 'text'
+        state.accumulated_tool_calls.clear()
+        state.input_tokens = 0
+        state.output_tokens = 0
+        state.stop_reason = None
+        self._msg_start_frame = None
+        self._index_bytes = b'0'
+        return self
+
+    def emit_early_stream_start(self) -> List[bytes]:
         """
         Emit message_start and content_block_start events immediately.
 
@@ -59,7 +131,7 @@ class StreamTranslator:
         waiting for content generation.
 
         Returns:
-            List of SSE event strings for message_start and content_block_start
+            List of SSE event byte frames for message_start and content_block_start
         """
         events = []
 
@@ -75,45 +147,59 @@ class StreamTranslator:
         logger.debug("Emitted early message_start and content_block_start")
         return events
 
-    def translate_chunk(self, openai_chunk: bytes) -> List[str]:
+    def translate_chunk(self, openai_chunk: bytes) -> bytes:
         """
         Translate a single OpenAI SSE chunk to Anthropic SSE events.
 
+        Stays bytes-native end to end: the input buffer is parsed in
+        place and frames are emitted as bytes, so nothing on the
+        per-token path pays for a UTF-8 decode/re-encode round trip.
+
         Args:
             openai_chunk: Raw SSE chunk bytes from OpenAI
 
         Returns:
-            List of Anthropic SSE event strings (each includes event: and data: lines)
+            All resulting Anthropic SSE event frames coalesced into one
+            bytes payload (b'' when the chunk produces no events), so
+            the HTTP layer does a single write per chunk
         """
-        events = []
-
-        # Parse the chunk
-        try:
-            chunk_str = openai_chunk.decode('utf-8').strip()
-        except Exception as e:
-            logger.error(f"Failed to decode chunk: {e}")
-            return events
+        buf = openai_chunk.strip()
 
         # Skip empty lines
-        if not chunk_str:
-            return events
+        if not buf:
+            return b''
 
         # Handle [DONE] marker
-        if chunk_str == 'data: [DONE]':
-            events.extend(self._emit_stream_end())
-            return events
+        if buf == b'data: [DONE]':
+            return self._emit_stream_end()
+
+        # SSE comments (": keepalive" pings) never carry data - drop
+        # them before paying for a parse attempt
+        if buf[:1] == b':':
+            return b''
 
         # Parse data payload
-        if not chunk_str.startswith('data: '):
+        if not buf.startswith(b'data: '):
             # Log unexpected chunk format
-            logger.debug(f"Unexpected chunk format: {chunk_str[:100]}")
-            return events
+            logger.debug("Unexpected chunk format: %s", buf[:100])
+            return b''
+
+        # Chunk payloads are JSON objects, so anything not ending in '}'
+        # is partial or malformed - skip it without invoking the parser
+        if buf[-1:] != b'}':
+            logger.debug("Skipping non-object chunk payload: %s", buf[:100])
+            return b''
 
         try:
-            data = json.loads(chunk_str[6:])  # Skip "data: "
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse chunk JSON: {e}, chunk: {chunk_str[:200]}")
-            return events
+            data = _loads(buf[6:])  # Skip "data: "
+        except _JSONDecodeError as e:
+            logger.warning("Failed to parse chunk JSON: %s, chunk: %s", e, buf[:200])
+            return b''
+
+        events = bytearray()
+        # LOAD_FAST beats attribute chasing in a method that reads state
+        # on nearly every line, once per streamed token
+        state = self.state
 
         # Check for error in stream (some APIs send errors via SSE)
         if 'error' in data:
@@ -132,216 +218,182 @@ class StreamTranslator:
                     "message": error_msg
                 }
             }
-            events.append(f"event: error\ndata: {json.dumps(error_event)}\n\n")
-            return events
-
-        # Extract delta from choices
-        choices = data.get('choices', [])
+            events += _PREFIX_ERROR + _dumps(error_event) + _SUFFIX
+            return bytes(events)
+
+        # Usage may arrive on its own final chunk or piggybacked on any
+        # chunk (stream_options include_usage); record it up front so
+        # usage-only chunks return before any of the delta branches run
+        usage = data.get('usage')
+        if usage is not None:
+            state.input_tokens = usage.get('prompt_tokens', 0)
+            state.output_tokens = usage.get('completion_tokens', 0)
+
+        choices = data.get('choices')
         if not choices:
-            # Check for usage in final chunk
-            if 'usage' in data:
-                self.state.input_tokens = data['usage'].get('prompt_tokens', 0)
-                self.state.output_tokens = data['usage'].get('completion_tokens', 0)
-            return events
+            return bytes(events)
 
         choice = choices[0]
         delta = choice.get('delta', {})
         finish_reason = choice.get('finish_reason')
 
         # Emit message_start if not done yet
-        if not self.state.message_started:
-            events.append(self._emit_message_start())
-            self.state.message_started = True
+        if not state.message_started:
+            events += self._emit_message_start()
+            state.message_started = True
 
         # Handle role (first chunk usually)
-        if 'role' in delta and not self.state.content_block_started:
+        if 'role' in delta and not state.content_block_started:
             # Role chunk - content block will start with next content
             pass
 
         # Handle text content
         if 'content' in delta and delta['content']:
-            if not self.state.content_block_started:
-                events.append(self._emit_content_block_start('text'))
-                self.state.content_block_started = True
-                self.state.current_block_type = 'text'
+            if not state.content_block_started:
+                events += self._emit_content_block_start('text')
+                state.content_block_started = True
+                state.current_block_type = 'text'
 
-            events.append(self._emit_text_delta(delta['content']))
+            events += self._emit_text_delta(delta['content'])
 
         # Handle tool calls
         if 'tool_calls' in delta:
+            acc = state.accumulated_tool_calls
             for tc_delta in delta['tool_calls']:
                 tc_index = tc_delta.get('index', 0)
+                if tc_index >= len(acc):
+                    acc.extend([None] * (tc_index + 1 - len(acc)))
 
                 # New tool call - initialize but DON'T emit content_block_start yet
                 # We need to wait until we have the function name
-                if tc_index not in self.state.accumulated_tool_calls:
-                    self.state.accumulated_tool_calls[tc_index] = {
-                        'id': tc_delta.get('id', f'toolu_{uuid.uuid4().hex[:24]}'),
+                tc_data = acc[tc_index]
+                if tc_data is None:
+                    tc_data = acc[tc_index] = {
+                        'id': tc_delta.get('id', f'toolu_{_new_id24()}'),
                         'name': '',
-                        'input_json': '',
+                        # bytearray so appending fragments is an O(1)
+                        # amortized extend, not a full str reallocation
+                        'input_json': bytearray(),
                         'block_started': False  # Track if we've emitted content_block_start
                     }
 
-                # Accumulate tool call data
-                tc_data = self.state.accumulated_tool_calls[tc_index]
-
                 # Update ID if provided
                 if 'id' in tc_delta:
                     tc_data['id'] = tc_delta['id']
 
-                if 'function' in tc_delta:
-                    if 'name' in tc_delta['function']:
-                        tc_data['name'] = tc_delta['function']['name']
+                func = tc_delta.get('function')
+                if func is not None:
+                    name = func.get('name')
+                    if name is not None:
+                        tc_data['name'] = name
 
                     # Once we have the name, we can emit content_block_start
                     if tc_data['name'] and not tc_data['block_started']:
                         # End previous content block if any
-                        if self.state.content_block_started and self.state.current_block_type == 'text':
-                            events.append(self._emit_content_block_stop())
-                            self.state.current_block_index += 1
+                        if state.content_block_started and state.current_block_type == 'text':
+                            events += self._emit_content_block_stop()
+                            state.current_block_index += 1
+                            self._index_bytes = str(state.current_block_index).encode()
 
                         # Now emit content_block_start with the name
-                        events.append(self._emit_content_block_start('tool_use', tc_index))
-                        self.state.content_block_started = True
-                        self.state.current_block_type = 'tool_use'
+                        events += self._emit_content_block_start('tool_use', tc_index)
+                        state.content_block_started = True
+                        state.current_block_type = 'tool_use'
                         tc_data['block_started'] = True
 
-                    if 'arguments' in tc_delta['function']:
-                        tc_data['input_json'] += tc_delta['function']['arguments']
+                    args_frag = func.get('arguments')
+                    if args_frag is not None:
+                        tc_data['input_json'] += args_frag.encode()
                         # Only emit delta if block has started
                         if tc_data['block_started']:
-                            events.append(self._emit_input_json_delta(tc_delta['function']['arguments']))
+                            events += self._emit_input_json_delta(args_frag)
 
         # Handle finish_reason
         if finish_reason:
-            self.state.stop_reason = self._translate_finish_reason(finish_reason)
+            state.stop_reason = _FINISH_REASON_MAP.get(finish_reason, 'end_turn')
 
             # End current content block
-            if self.state.content_block_started:
-                events.append(self._emit_content_block_stop())
+            if state.content_block_started:
+                events += self._emit_content_block_stop()
 
-        return events
+        return bytes(events)
 
-    def _emit_message_start(self) -> str:
-        """Emit message_start event."""
-        message = {
-            'id': self.state.message_id,
-            'type': 'message',
-            'role': 'assistant',
-            'content': [],
-            'model': self.state.model,
-            'stop_reason': None,
-            'stop_sequence': None,
-            'usage': {
-                'input_tokens': self.state.input_tokens,
-                'output_tokens': self.state.output_tokens
-            }
-        }
-
-        event_data = {
-            'type': 'message_start',
-            'message': message
-        }
+    def _emit_message_start(self) -> bytes:
+        """
+        Emit message_start event.
 
-        return f"event: message_start\ndata: {json.dumps(event_data)}\n\n"
+        The message id and frame are built lazily on first emit and
+        cached - the frame's contents (id, model, zeroed usage; real
+        usage arrives long after this frame is sent) never change, and
+        streams that error out before emitting skip the id's entropy
+        draw entirely.
+        """
+        if self._msg_start_frame is None:
+            self.state.message_id = f"msg_{_new_id24()}"
+            self._msg_start_frame = _PREFIX_MESSAGE_START + _dumps({
+                'type': 'message_start',
+                'message': {
+                    'id': self.state.message_id,
+                    'type': 'message',
+                    'role': 'assistant',
+                    'content': [],
+                    'model': self.state.model,
+                    'stop_reason': None,
+                    'stop_sequence': None,
+                    'usage': {'input_tokens': 0, 'output_tokens': 0}
+                }
+            }) + _SUFFIX
+        return self._msg_start_frame
 
-    def _emit_content_block_start(self, block_type: str, index: Optional[int] = None) -> str:
+    def _emit_content_block_start(self, block_type: str, index: Optional[int] = None) -> bytes:
         """Emit content_block_start event."""
         if index is None:
             index = self.state.current_block_index
 
         if block_type == 'text':
-            content_block = {
-                'type': 'text',
-                'text': ''
-            }
-        else:  # tool_use
-            tc_data = self.state.accumulated_tool_calls.get(index, {})
-            content_block = {
-                'type': 'tool_use',
-                'id': tc_data.get('id', f'toolu_{uuid.uuid4().hex[:24]}'),
-                'name': tc_data.get('name', ''),
-                'input': {}
-            }
+            # Fixed shape apart from the index - splice the template
+            return (_TPL_BLOCK_START_TEXT + str(index).encode()
+                    + b',"content_block":{"type":"text","text":""}}\n\n')
 
+        # tool_use - id and name need real escaping, so serialize the dict
+        acc = self.state.accumulated_tool_calls
+        tc_data = acc[index] if index < len(acc) and acc[index] is not None else {}
         event_data = {
             'type': 'content_block_start',
             'index': index,
-            'content_block': content_block
+            'content_block': {
+                'type': 'tool_use',
+                'id': tc_data.get('id', f'toolu_{_new_id24()}'),
+                'name': tc_data.get('name', ''),
+                'input': {}
+            }
         }
 
-        return f"event: content_block_start\ndata: {json.dumps(event_data)}\n\n"
+        return _PREFIX_BLOCK_START + _dumps(event_data) + _SUFFIX
 
-    def _emit_text_delta(self, text: str) -> str:
+    def _emit_text_delta(self, text: str) -> bytes:
         """Emit content_block_delta event for text."""
-        event_data = {
-            'type': 'content_block_delta',
-            'index': self.state.current_block_index,
-            'delta': {
-                'type': 'text_delta',
-                'text': text
-            }
-        }
-
-        return f"event: content_block_delta\ndata: {json.dumps(event_data)}\n\n"
+        return (_TPL_DELTA_INDEX + self._index_bytes
+                + _TPL_TEXT_DELTA + _dumps(text) + b'}}\n\n')
 
-    def _emit_input_json_delta(self, json_fragment: str) -> str:
+    def _emit_input_json_delta(self, json_fragment: str) -> bytes:
         """Emit content_block_delta event for tool input JSON."""
-        # Find the tool call index
-        tc_index = self.state.current_block_index
+        return (_TPL_DELTA_INDEX + self._index_bytes
+                + _TPL_JSON_DELTA + _dumps(json_fragment) + b'}}\n\n')
 
-        event_data = {
-            'type': 'content_block_delta',
-            'index': tc_index,
-            'delta': {
-                'type': 'input_json_delta',
-                'partial_json': json_fragment
-            }
-        }
-
-        return f"event: content_block_delta\ndata: {json.dumps(event_data)}\n\n"
-
-    def _emit_content_block_stop(self) -> str:
+    def _emit_content_block_stop(self) -> bytes:
         """Emit content_block_stop event."""
-        event_data = {
-            'type': 'content_block_stop',
-            'index': self.state.current_block_index
-        }
-
-        return f"event: content_block_stop\ndata: {json.dumps(event_data)}\n\n"
-
-    def _emit_stream_end(self) -> List[str]:
-        """Emit final events to close the stream."""
-        events = []
-
-        # message_delta with final usage and stop_reason
-        event_data = {
-            'type': 'message_delta',
-            'delta': {
-                'stop_reason': self.state.stop_reason or 'end_turn',
-                'stop_sequence': None
-            },
-            'usage': {
-                'output_tokens': self.state.output_tokens
-            }
-        }
-        events.append(f"event: message_delta\ndata: {json.dumps(event_data)}\n\n")
-
-        # message_stop
-        events.append(f"event: message_stop\ndata: {{\"type\":\"message_stop\"}}\n\n")
-
-        return events
-
-    def _translate_finish_reason(self, finish_reason: str) -> str:
-        """Translate OpenAI finish_reason to Anthropic stop_reason."""
-        mapping = {
-            'stop': 'end_turn',
-            'length': 'max_tokens',
-            'tool_calls': 'tool_use',
-            'content_filter': 'end_turn',
-            'function_call': 'tool_use',
-        }
-        return mapping.get(finish_reason, 'end_turn')
+        return _TPL_BLOCK_STOP + self._index_bytes + b'}\n\n' 
+
+    def _emit_stream_end(self) -> bytes:
+        """Emit the final events that close the stream as one payload."""
+        # message_delta with final usage and stop_reason; stop_reason
+        # comes from _FINISH_REASON_MAP's fixed vocabulary, so it can be
+        # spliced into the template without escaping
+        return (_TPL_MESSAGE_DELTA + (self.state.stop_reason or 'end_turn').encode()
+                + b'","stop_sequence":null},"usage":{"output_tokens":'
+                + str(self.state.output_tokens).encode() + b'}}\n\n'
+                + _MESSAGE_STOP_FRAME)
 
     def get_usage(self) -> Dict[str, int]:
         """Get accumulated token usage."""
@@ -351,12 +403,39 @@ class StreamTranslator:
         }
 
 
+# Freelist of translator/state pairs - under sustained streaming QPS
+# this swaps a per-request StreamTranslator + StreamState allocation for
+# a deque pop and field reset. deque append/pop are atomic under the
+# GIL, and the bound keeps an idle burst from pinning memory.
+_TRANSLATOR_POOL: deque = deque(maxlen=1024)
+
+
+def acquire_translator(original_model: str = 'claude-sonnet-4-20250514') -> StreamTranslator:
+    """Get a StreamTranslator for a new stream, reusing a pooled one if available."""
+    try:
+        translator = _TRANSLATOR_POOL.pop()
+    except IndexError:
+        return StreamTranslator(original_model)
+    return translator.reset(original_model)
+
+
+def release_translator(translator: StreamTranslator) -> None:
+    """Return a finished translator to the pool."""
+    _TRANSLATOR_POOL.append(translator)
+
+
 def generate_placeholder_stream(
     model: str = 'claude-sonnet-4-20250514',
     content: str = 'This is a placeholder streaming response from cc-launcher.'
-) -> Generator[str, None, None]:
-    """Generate a placeholder Anthropic streaming response."""
-    msg_id = f"msg_{uuid.uuid4().hex[:24]}"
+) -> Generator[bytes, None, None]:
+    """
+    Generate a placeholder Anthropic streaming response.
+
+    All frames are built up front and just yielded, so consumers that
+    materialize the stream (the proxy caches the frames per model) pay
+    the serialization once and never block on simulated pacing.
+    """
+    msg_id = f"msg_{_new_id24()}"
 
     # message_start
     message = {
@@ -369,31 +448,30 @@ def generate_placeholder_stream(
         'stop_sequence': None,
         'usage': {'input_tokens': 100, 'output_tokens': 0}
     }
-    yield f"event: message_start\ndata: {json.dumps({'type': 'message_start', 'message': message})}\n\n"
-
-    # content_block_start
-    yield f"event: content_block_start\ndata: {json.dumps({'type': 'content_block_start', 'index': 0, 'content_block': {'type': 'text', 'text': ''}})}\n\n"
-
-    # ping event (like real Anthropic API)
-    yield 'event: ping\ndata: {"type": "ping"}\n\n'
-
-    # content_block_delta - stream word by word
     words = content.split()
-    for i, word in enumerate(words):
-        text = word + (' ' if i < len(words) - 1 else '')
-        delta_data = {
+    # Bake the joining space into every token but the last, so the frame
+    # build below has no per-word length check or branch
+    tokens = [w + ' ' for w in words[:-1]] + words[-1:]
+
+    frames = [
+        _PREFIX_MESSAGE_START + _dumps({'type': 'message_start', 'message': message}) + _SUFFIX,
+        _PREFIX_BLOCK_START + _dumps({'type': 'content_block_start', 'index': 0, 'content_block': {'type': 'text', 'text': ''}}) + _SUFFIX,
+        # ping event (like real Anthropic API)
+        b'event: ping\ndata: {"type": "ping"}\n\n',
+    ]
+
+    # content_block_delta - one frame per word
+    frames.extend(
+        _PREFIX_DELTA + _dumps({
             'type': 'content_block_delta',
             'index': 0,
-            'delta': {'type': 'text_delta', 'text': text}
-        }
-        yield f"event: content_block_delta\ndata: {json.dumps(delta_data)}\n\n"
-        time.sleep(0.05)  # Simulate streaming delay
-
-    # content_block_stop
-    yield f"event: content_block_stop\ndata: {json.dumps({'type': 'content_block_stop', 'index': 0})}\n\n"
+            'delta': {'type': 'text_delta', 'text': token}
+        }) + _SUFFIX
+        for token in tokens
+    )
 
-    # message_delta
-    yield f"event: message_delta\ndata: {json.dumps({'type': 'message_delta', 'delta': {'stop_reason': 'end_turn', 'stop_sequence': None}, 'usage': {'output_tokens': len(words)}})}\n\n"
+    frames.append(_PREFIX_BLOCK_STOP + _dumps({'type': 'content_block_stop', 'index': 0}) + _SUFFIX)
+    frames.append(_PREFIX_MESSAGE_DELTA + _dumps({'type': 'message_delta', 'delta': {'stop_reason': 'end_turn', 'stop_sequence': None}, 'usage': {'output_tokens': len(words)}}) + _SUFFIX)
+    frames.append(_MESSAGE_STOP_FRAME)
 
-    # message_stop
-    yield f"event: message_stop\ndata: {{\"type\":\"message_stop\"}}\n\n"
+    yield from frames